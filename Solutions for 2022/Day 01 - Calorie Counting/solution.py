@@ -1,6 +1,13 @@
 """Solution for day 1 - Calorie Counting."""
+from __future__ import annotations
+
+import codecs
+import heapq
 import os
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 EXAMPLE_INPUT = """
 1000
@@ -25,15 +32,162 @@ def _parse_input(data: str) -> List[List[int]]:
     return [list(map(int, elf.splitlines())) for elf in data.strip().split("\n\n")]
 
 
+def _parse_input_streaming(path: str) -> List[List[int]]:
+    """Parse input data file one elf at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_records
+
+    return [list(map(int, elf)) for elf in iter_records(path)]
+
+
 def solution_part_1(elf_calories: List[List[int]]) -> int:
     """Solution to Part 1."""
     return max(sum(i) for i in elf_calories)
 
 
-def solution_part_2(elf_calories: List[List[int]]) -> List[int]:
-    """Solution to Part 2."""
+def solution_part_2(elf_calories: List[List[int]], top_k: int = 3) -> int:
+    """Solution to Part 2, the total calories carried by the `top_k` elves carrying the most."""
+    if top_k <= 0:
+        return 0
     sorted_elves = sorted((sum(i) for i in elf_calories), reverse=True)
-    return sum(sorted_elves[:3])
+    return sum(sorted_elves[:top_k])
+
+
+def _parse_input_array(data: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse input data into a single array of every food item's calories, using NumPy.
+
+    Alongside the calories, the index within that array of each elf's first food item is returned,
+    with elves separated by the blank lines in the input.
+
+    """
+    import numpy as np
+
+    data = data.strip()
+    # Whitespace separated text parsing skips the blank lines, leaving just the food items
+    calories = np.fromstring(data, dtype=np.int64, sep=" ")
+    # Find the start & end of every line from the newline positions, where blank lines are empty
+    newlines = np.flatnonzero(np.frombuffer(data.encode("ascii"), dtype=np.uint8) == ord("\n"))
+    blank_lines = np.append(newlines, len(data)) - np.insert(newlines + 1, 0, 0) == 0
+    # Number each food item's elf by counting the blank lines before it, then find where each starts
+    elves = np.cumsum(blank_lines)[~blank_lines]
+    elf_starts = np.flatnonzero(np.diff(elves, prepend=-1))
+    return calories, elf_starts
+
+
+def elf_totals(calories: np.ndarray, elf_starts: np.ndarray) -> np.ndarray:
+    """Total calories carried by each elf, summing each elf's items with a segmented reduction."""
+    import numpy as np
+
+    return np.add.reduceat(calories, elf_starts)
+
+
+def solution_part_1_array(totals: np.ndarray) -> int:
+    """Solution to Part 1, from an array of each elf's total calories."""
+    return int(totals.max())
+
+
+def solution_part_2_array(totals: np.ndarray, top_k: int = 3) -> int:
+    """Solution to Part 2, from an array of each elf's total calories.
+
+    Rather than sorting every elf's total, only the `top_k` largest are selected, with a partial
+    sort which runs in linear time.
+
+    """
+    import numpy as np
+
+    if top_k <= 0:
+        return 0
+    if top_k >= len(totals):
+        return int(totals.sum())
+    return int(np.partition(totals, -top_k)[-top_k:].sum())
+
+
+class TopElfTracker:
+    """Track the elves carrying the most calories, while their inventories are still arriving.
+
+    Input is fed in as it arrives, following the same rules as `_parse_input` (one food item per
+    line, with elves separated by blank lines), in pieces of any size - lines may even be split
+    across pieces. Only a min-heap of the `top_k` largest elf totals found so far is kept, along
+    with the running total of the elf currently being read and any incomplete trailing line, so
+    memory use stays constant however much input is fed in.
+
+    The Part 1 and Part 2 answers for everything fed in so far can be queried at any point in
+    O(top_k) time, counting the elf currently being read as if its inventory were complete.
+
+    """
+
+    __slots__ = ("top_k", "totals", "current", "pending", "offset")
+
+    def __init__(self, top_k: int = 3):
+        """Start tracking the `top_k` largest elf totals, with no input fed in yet."""
+        self.top_k = top_k
+        # Min-heap of the largest elf totals found so far
+        self.totals: List[int] = []
+        # Running total of the elf currently being read, if any
+        self.current: Optional[int] = None
+        # Incomplete trailing line held back from the last piece of input
+        self.pending = ""
+        # Number of bytes of the file consumed by `feed_file` so far
+        self.offset = 0
+
+    def feed(self, text: str) -> None:
+        """Consume the next piece of input, holding back any incomplete trailing line."""
+        *lines, self.pending = (self.pending + text).split("\n")
+        self.feed_lines(lines)
+
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Consume complete lines of input, without line endings."""
+        for line in lines:
+            line = line.strip()
+            if line:
+                self.current = int(line) + (self.current or 0)
+            else:
+                self._end_elf()
+
+    def feed_file(self, path: str, chunk_size: int = 1 << 20) -> None:
+        """Consume whatever has been appended to the file since it was last fed in.
+
+        The file is read `chunk_size` bytes at a time, so memory stays bounded however much has
+        been appended. Any character split across the end of the file so far is left to be read
+        again next time.
+
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(path, "rb") as f:
+            f.seek(self.offset)
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                self.offset += len(chunk)
+                self.feed(decoder.decode(chunk))
+        self.offset -= len(decoder.getstate()[0])
+
+    def finish(self) -> None:
+        """Mark the end of the input, consuming any final line lacking a line ending."""
+        self.feed_lines([self.pending])
+        self.pending = ""
+        self._end_elf()
+
+    def _end_elf(self) -> None:
+        """Record the elf currently being read (if any), keeping only the largest totals."""
+        if self.current is None:
+            return
+        if len(self.totals) < self.top_k:
+            heapq.heappush(self.totals, self.current)
+        elif self.totals:
+            # Otherwise no totals are being kept at all, i.e. `top_k <= 0`
+            heapq.heappushpop(self.totals, self.current)
+        self.current = None
+
+    def top_totals(self) -> List[int]:
+        """The largest elf totals so far, including the elf currently being read, largest first."""
+        totals = self.totals if self.current is None else self.totals + [self.current]
+        return heapq.nlargest(self.top_k, totals)
+
+    def solution_part_1(self) -> int:
+        """Solution to Part 1 for the input so far."""
+        return max(self.top_totals(), default=0)
+
+    def solution_part_2(self) -> int:
+        """Solution to Part 2 for the input so far."""
+        return sum(self.top_totals())
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """Solution for day 2 - Rock Paper Scissors."""
+import functools
 import os
-from typing import Dict, List
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 
 EXAMPLE_INPUT = """
 A Y
@@ -50,39 +53,150 @@ OPPONENT_RESPONSE_SCORING = {
     },
 }
 
-def _parse_input(data: str, response_mapping: Dict[str, str]) -> List[str]:
-    """Parse input data into a more malleable format."""
-    code_mapping = {
-        **OPPONENT_CODE_MAPPING,
-        **response_mapping,
+
+def _score_table(response_mapping: Dict[str, str]) -> Dict[str, int]:
+    """Score of each of the nine possible lines of raw codes, under the given response mapping."""
+    return {
+        f"{opponent_code} {response_code}": OPPONENT_RESPONSE_SCORING[opponent][response]
+        for opponent_code, opponent in OPPONENT_CODE_MAPPING.items()
+        for response_code, response in response_mapping.items()
+    }
+
+
+def _score_matrix(response_mapping: Dict[str, str]) -> List[List[int]]:
+    """3x3 table of scores, indexed by the opponent code's and then the response code's position."""
+    return [
+        [OPPONENT_RESPONSE_SCORING[opponent][response] for response in response_mapping.values()]
+        for opponent in OPPONENT_CODE_MAPPING.values()
+    ]
+
+
+def solution_bytes(data: bytes) -> Tuple[int, int]:
+    """Solution to both parts, scoring the raw bytes of the input in a single pass.
+
+    Every line is exactly four bytes, e.g. b"A Y\n", so the input is viewed (without copying) as
+    an array of 32-bit integers, one per line. Each of the nine possible integers is looked up in a
+    table built from the 3x3 score tables of both parts, which packs the part 1 score into the low
+    bits and the part 2 score above them, so a single sum totals both parts at once. Just enough low
+    bits are reserved that the part 1 total can never overflow into the part 2 total. A final line
+    lacking its newline is scored on its own.
+
+    Should the lines not all be four bytes (e.g. Windows line endings), each line's first and last
+    bytes are looked up in the 3x3 score tables instead.
+
+    """
+    part_1_matrix = _score_matrix(PART_1_RESPONSE_MAPPING)
+    part_2_matrix = _score_matrix(PART_2_RESPONSE_MAPPING)
+    # Find the bounds of the input without surrounding whitespace, rather than copying it to strip
+    start, stop = 0, len(data)
+    while start < stop and data[start] in b" \t\r\n":
+        start += 1
+    while stop > start and data[stop - 1] in b" \t\r\n":
+        stop -= 1
+    # Include the newline ending the last line, if it has one
+    last_line = b""
+    if data[stop:stop + 1] == b"\n":
+        stop += 1
+    elif stop > start:
+        last_line = data[stop - 3:stop]
+        stop -= 3
+
+    try:
+        lines = memoryview(data)[start:stop].cast("I")
+        shift = (max(map(max, part_1_matrix)) * (len(lines) + 1)).bit_length()
+        packed_scores = {}
+        for i, opponent_code in enumerate(OPPONENT_CODE_MAPPING):
+            for j, response_code in enumerate(PART_1_RESPONSE_MAPPING):
+                line = int.from_bytes(f"{opponent_code} {response_code}\n".encode(), sys.byteorder)
+                packed_scores[line] = part_1_matrix[i][j] | part_2_matrix[i][j] << shift
+        packed = sum(map(packed_scores.__getitem__, lines))
+        if last_line:
+            packed += packed_scores[int.from_bytes(last_line + b"\n", sys.byteorder)]
+        return packed & (1 << shift) - 1, packed >> shift
+    except (KeyError, TypeError):
+        # Cast fails (TypeError) unless the length is a multiple of four
+        part_1 = part_2 = 0
+        for line in (data[start:stop] + last_line).splitlines():
+            opponent, response = line[0] - ord("A"), line.rstrip()[-1] - ord("X")
+            part_1 += part_1_matrix[opponent][response]
+            part_2 += part_2_matrix[opponent][response]
+        return part_1, part_2
+
+
+def count_lines(data: bytes) -> Dict[str, int]:
+    """Count how many times each of the nine possible lines of raw codes, e.g. "A Y", occurs.
+
+    No line can contain another, and a line's codes can't span two lines, so each type of line is
+    counted with a single fast substring count over the raw bytes.
+
+    """
+    return {
+        f"{opponent_code} {response_code}": data.count(f"{opponent_code} {response_code}".encode())
+        for opponent_code in OPPONENT_CODE_MAPPING
+        for response_code in PART_1_RESPONSE_MAPPING
     }
-    for k, v in code_mapping.items():
-        data = data.replace(k, v)
-    return data.strip().split("\n")
 
 
-def solution(data: str, response_mapping: Dict[str, str]) -> int:
-    """Solution to both parts."""
-    predictions = _parse_input(data, response_mapping)
-    result = 0
-    for prediction in predictions:
-        opponent_choice, response = prediction.split()
-        result += OPPONENT_RESPONSE_SCORING[opponent_choice][response]
-    return result
+def _count_byte_range(path: str, byte_range: Tuple[int, int]) -> Dict[str, int]:
+    """Count each type of line within a range of bytes of the file."""
+    from aoc.loader import mapped_file
+
+    start, stop = byte_range
+    with mapped_file(path) as data:
+        return count_lines(data[start:stop])
+
+
+def count_file(
+    path: str, workers: Optional[int] = None, chunk_size: int = 1 << 24
+) -> Dict[str, int]:
+    """Count each type of line in a (potentially huge) file, counting chunks in parallel.
+
+    The file is split into chunks of roughly `chunk_size` bytes, aligned on newlines so no line is
+    split between chunks, which are counted across a pool of processes and the counts merged.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from aoc.loader import iter_byte_ranges, mapped_file
+
+    with mapped_file(path) as data:
+        byte_ranges = list(iter_byte_ranges(data, chunk_size))
+        # Not worth starting a pool of processes for a single chunk
+        if len(byte_ranges) <= 1:
+            return count_lines(data[:])
+
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_counts in executor.map(functools.partial(_count_byte_range, path), byte_ranges):
+            counts.update(chunk_counts)
+    return dict(counts)
+
+
+def score_counts(counts: Dict[str, int], response_mapping: Dict[str, str]) -> int:
+    """Total score from the counts of each type of line, under the given response mapping.
+
+    This is just the dot product of the nine counts with the nine scores, so once the lines have
+    been counted, any number of candidate response mappings can be scored in constant time each.
+
+    """
+    scores = _score_table(response_mapping)
+    return sum(scores[code] * count for code, count in counts.items())
 
 
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
+    part_1, part_2 = solution_bytes(EXAMPLE_INPUT.encode("ascii"))
     print("Results for given example:")
-    print("Part 1:", solution(EXAMPLE_INPUT, PART_1_RESPONSE_MAPPING))
-    print("Part 2:", solution(EXAMPLE_INPUT, PART_2_RESPONSE_MAPPING))
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
     # Load local data file
-    with open(os.path.join(os.path.dirname(__file__), "data.txt"), "r", encoding="utf-8") as f:
+    with open(os.path.join(os.path.dirname(__file__), "data.txt"), "rb") as f:
         data = f.read()
 
     # Execute solution for solution part 1 & 2
+    part_1, part_2 = solution_bytes(data)
     print("\nResults for full puzzle data:")
-    print("Part 1:", solution(data, PART_1_RESPONSE_MAPPING))
-    print("Part 2:", solution(data, PART_2_RESPONSE_MAPPING))
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
@@ -1,7 +1,14 @@
 """Solution for day 3 - Rucksack Reorganization."""
+from __future__ import annotations
+
+import operator
 import os
-import re
-from typing import List
+import string
+from functools import reduce
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 EXAMPLE_INPUT = """
 vJrwpWtwJgWrhcsFMMfFFhFp
@@ -11,10 +18,16 @@ wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
 ttgJtRGJQctTZtZT
 CrZsJsPPZsGzwwsLwLmpwMDw
 """
+# Each item type is a single bit, a-z being bits 0-25 and A-Z bits 26-51, i.e. its priority - 1
+ITEM_BITS = {item: 1 << bit for bit, item in enumerate(string.ascii_letters)}
+# Priority of each item type, keyed by its single bit
+BIT_PRIORITIES = {item_bit: bit + 1 for bit, item_bit in enumerate(ITEM_BITS.values())}
+ALL_ITEMS = (1 << len(ITEM_BITS)) - 1
+GROUP_SIZE = 3
 
 
 def calculate_cost(badge: str) -> int:
-    return ord(badge) - 96 + (58 if re.match("[A-Z]", badge) else 0)
+    return ord(badge) - 96 + (58 if badge.isupper() else 0)
 
 
 def solution_part_1(backpack_items: List[str]) -> int:
@@ -36,6 +49,96 @@ def solution_part_2(backpack_items: List[str]) -> int:
     return cost
 
 
+def solution_bitmask(backpack_items: Iterable[str]) -> Tuple[int, int]:
+    """Solution to both parts, in a single pass over the rucksacks using bitmasks.
+
+    Each compartment becomes a single integer with a bit set for each item type it contains, so
+    finding the items common to both compartments, or to each rucksack in a group, is just a bitwise
+    and. The priority of the common item is then looked up from its bit, which is isolated as the
+    lowest set bit with `mask & -mask`.
+
+    Each group's common items are narrowed down as each of its rucksacks arrives, so the rucksacks
+    can be streamed in (e.g. straight from `aoc.loader.iter_lines`) rather than indexed into, with
+    only a couple of integers kept between rucksacks.
+
+    """
+    # Bind the lookups locally, as this loop runs once per rucksack
+    or_, item_bit, priorities = operator.or_, ITEM_BITS.__getitem__, BIT_PRIORITIES
+    part_1 = part_2 = 0
+    group_mask = ALL_ITEMS
+    group_position = 0
+    for backpack in backpack_items:
+        backpack_size = len(backpack) // 2
+        first = reduce(or_, map(item_bit, backpack[:backpack_size]), 0)
+        second = reduce(or_, map(item_bit, backpack[backpack_size:]), 0)
+        overlap = first & second
+        part_1 += priorities[overlap & -overlap]
+
+        group_mask &= first | second
+        group_position += 1
+        if group_position == GROUP_SIZE:
+            part_2 += priorities[group_mask & -group_mask]
+            group_mask = ALL_ITEMS
+            group_position = 0
+    return part_1, part_2
+
+
+def _parse_input_array(data: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse input data into item presence matrices for each compartment, using NumPy.
+
+    Each matrix has a row per rucksack and a column per item type (ordered by priority), which is
+    True where that compartment of that rucksack contains that item type. Every rucksack's items
+    are scattered into the matrices at once, without looping over the rucksacks in Python.
+
+    """
+    import numpy as np
+
+    # Priority - 1 of each item type's byte, i.e. its column in the presence matrices
+    columns = np.zeros(256, dtype=np.intp)
+    columns[np.frombuffer(string.ascii_letters.encode(), dtype=np.uint8)] = np.arange(52)
+
+    items = np.frombuffer(data.strip().encode("ascii"), dtype=np.uint8)
+    newlines = np.flatnonzero(items == ord("\n"))
+    starts = np.insert(newlines + 1, 0, 0)
+    ends = np.append(newlines, len(items))
+    # Find each item's rucksack, and whether it's in the first half (compartment) of that rucksack
+    rucksacks = np.repeat(np.arange(len(starts)), ends - starts + 1)[:len(items)]
+    is_item = items != ord("\n")
+    in_first = np.arange(len(items)) < (starts + (ends - starts) // 2)[rucksacks]
+
+    first = np.zeros((len(starts), 52), dtype=bool)
+    second = np.zeros((len(starts), 52), dtype=bool)
+    first[rucksacks[is_item & in_first], columns[items[is_item & in_first]]] = True
+    second[rucksacks[is_item & ~in_first], columns[items[is_item & ~in_first]]] = True
+    return first, second
+
+
+def solution_part_1_array(first: np.ndarray, second: np.ndarray) -> int:
+    """Solution to Part 1, from the item presence matrices of each compartment.
+
+    The items in both compartments of every rucksack are found with a single array-wide and, then
+    the column (priority - 1) of each rucksack's common item is found with an argmax per row.
+
+    """
+    return int((first & second).argmax(axis=1).sum()) + len(first)
+
+
+def solution_part_2_array(
+    first: np.ndarray, second: np.ndarray, group_size: int = GROUP_SIZE
+) -> int:
+    """Solution to Part 2, from the item presence matrices of each compartment.
+
+    The rucksacks are reshaped into groups of `group_size`, such that the items common to every
+    rucksack in each group are found with a single and across the group axis.
+
+    """
+    if len(first) % group_size:
+        raise ValueError(f"{len(first)} rucksacks cannot be split into groups of {group_size}.")
+    rucksacks = (first | second).reshape(-1, group_size, first.shape[1])
+    badges = rucksacks.all(axis=1)
+    return int(badges.argmax(axis=1).sum()) + len(badges)
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
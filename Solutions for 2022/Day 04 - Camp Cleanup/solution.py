@@ -1,7 +1,13 @@
 """Solution for day 4 - Camp Cleanup."""
+from __future__ import annotations
+
 import os
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 EXAMPLE_INPUT = """
 2-4,6-8
@@ -11,6 +17,8 @@ EXAMPLE_INPUT = """
 6-6,4-6
 2-6,4-8
 """
+# Translation table swapping the separators in each line, e.g. "2-4,6-8", for spaces
+SEPARATORS = str.maketrans("-,", "  ")
 
 
 @dataclass
@@ -32,11 +40,124 @@ class CleaningPairing:
         )
 
 
-def _parse_input(data: List[str]) -> List[str]:
+class CleaningAssignments(NamedTuple):
+    """Every pairing's section assignments, stored column by column in contiguous NumPy arrays."""
+
+    elf_1_start: np.ndarray
+    elf_1_stop: np.ndarray
+    elf_2_start: np.ndarray
+    elf_2_stop: np.ndarray
+
+
+class Assignment(NamedTuple):
+    """A single elf's section assignment, from the given pairing (index) and elf (1 or 2)."""
+
+    pairing: int
+    elf: int
+    start: int
+    stop: int
+
+
+class IntervalIndex:
+    """Index of every elf's section assignment across the whole camp, to query overlaps quickly.
+
+    Assignments are sorted by their start section, and treated as an implicit balanced binary
+    search tree (each range of the sorted list being rooted at its middle assignment). Each node
+    records the furthest stop section within its subtree, so any subtree which ends before a query
+    range can be skipped entirely, as can everything after an assignment which starts after it.
+    Only the paths down to matching assignments are explored, so queries take O((k + 1) log n) time
+    for k results, rather than checking every assignment.
+
+    Coverage of each section is answered separately by bisecting the sorted start and stop sections.
+
+    """
+
+    def __init__(self, assignments: Iterable[Assignment]):
+        """Build the index from any collection of assignments."""
+        self.assignments = sorted(assignments, key=lambda assignment: assignment.start)
+        self.starts = [assignment.start for assignment in self.assignments]
+        self.sorted_stops = sorted(assignment.stop for assignment in self.assignments)
+        self.max_stops = [0] * len(self.assignments)
+        self._build(0, len(self.assignments))
+
+    @classmethod
+    def from_pairings(cls, assignment_pairings: List[CleaningPairing]) -> IntervalIndex:
+        """Build the index from both elves' assignments in every pairing."""
+        return cls(
+            assignment
+            for idx, pairing in enumerate(assignment_pairings)
+            for assignment in (
+                Assignment(idx, 1, pairing.elf_1_start, pairing.elf_1_stop),
+                Assignment(idx, 2, pairing.elf_2_start, pairing.elf_2_stop),
+            )
+        )
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Record the furthest stop section in the subtree of assignments lo:hi, and return it."""
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        self.max_stops[mid] = max(
+            self.assignments[mid].stop, self._build(lo, mid), self._build(mid + 1, hi)
+        )
+        return self.max_stops[mid]
+
+    def _search(self, lo: int, hi: int, max_start: int, min_stop: int) -> Iterator[Assignment]:
+        """Find assignments in lo:hi starting at or before `max_start` and stopping at or after
+        `min_stop`.
+
+        """
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        # Nothing in this subtree reaches far enough
+        if self.max_stops[mid] < min_stop:
+            return
+        yield from self._search(lo, mid, max_start, min_stop)
+        # Everything after this assignment starts too late if it does
+        if self.starts[mid] <= max_start:
+            if self.assignments[mid].stop >= min_stop:
+                yield self.assignments[mid]
+            yield from self._search(mid + 1, hi, max_start, min_stop)
+
+    def overlapping(self, start: int, stop: int) -> List[Assignment]:
+        """Every assignment sharing any section with the (inclusive) range of sections."""
+        return list(self._search(0, len(self.assignments), stop, start))
+
+    def containing(self, start: int, stop: int) -> List[Assignment]:
+        """Every assignment which fully contains the (inclusive) range of sections."""
+        return list(self._search(0, len(self.assignments), start, stop))
+
+    def coverage(self, section: int) -> int:
+        """Number of elves whose assignment includes the given section."""
+        started = bisect_right(self.starts, section)
+        stopped = bisect_left(self.sorted_stops, section)
+        return started - stopped
+
+    def containment_pairs(self) -> Iterator[Tuple[Assignment, Assignment]]:
+        """Every `(outer, inner)` pair of different elves where the outer contains the inner.
+
+        Elves with identical assignments contain one another, so are paired in both orders.
+
+        """
+        for inner in self.assignments:
+            for outer in self.containing(inner.start, inner.stop):
+                if outer is not inner:
+                    yield outer, inner
+
+
+def _parse_input(data: Iterable[str]) -> List[CleaningPairing]:
     """Parse input data into a more malleable format."""
     return [CleaningPairing.from_pairing(i) for i in data]
 
 
+def _parse_input_streaming(path: str) -> List[CleaningPairing]:
+    """Parse input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_input(line for line in iter_lines(path) if line)
+
+
 def solution_part_1(assignment_pairings: List[CleaningPairing]) -> int:
     """Solution to Part 1."""
     overlap = 0
@@ -68,6 +189,35 @@ def solution_part_2(assignment_pairings: List[CleaningPairing]) -> int:
     return overlap
 
 
+def _parse_input_array(data: str) -> CleaningAssignments:
+    """Parse input data into columns of section assignments, using NumPy.
+
+    The separators are swapped for spaces, so that every section number in the input can be read
+    into a single integer array in one scan, which is then split into its four columns.
+
+    """
+    import numpy as np
+
+    sections = np.fromstring(data.translate(SEPARATORS), dtype=np.int64, sep=" ")
+    # Copy each (strided) column out into its own contiguous array
+    return CleaningAssignments(*np.ascontiguousarray(sections.reshape(-1, 4).T))
+
+
+def solution_part_1_array(assignments: CleaningAssignments) -> int:
+    """Solution to Part 1, checking every pairing for full overlap at once."""
+    elf_1_start, elf_1_stop, elf_2_start, elf_2_stop = assignments
+    return int((
+        ((elf_1_start <= elf_2_start) & (elf_1_stop >= elf_2_stop)) |
+        ((elf_2_start <= elf_1_start) & (elf_2_stop >= elf_1_stop))
+    ).sum())
+
+
+def solution_part_2_array(assignments: CleaningAssignments) -> int:
+    """Solution to Part 2, checking every pairing for any overlap at once."""
+    elf_1_start, elf_1_stop, elf_2_start, elf_2_stop = assignments
+    return int(((elf_1_stop >= elf_2_start) & (elf_2_stop >= elf_1_start)).sum())
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
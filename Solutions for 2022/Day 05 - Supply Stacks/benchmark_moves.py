@@ -0,0 +1,120 @@
+"""Benchmark moving crates with the top of each stack at the end of its list, against the original.
+
+The original `SupplyStack.make_move` kept the top container of each stack at the start of its
+list, so every move rebuilt both stacks in full, costing O(stack height) even for a single crate.
+With the top at the end of the list, each move only costs O(crates moved).
+
+Both versions are run over the same randomly generated towers and moves. The original is far too
+slow to replay millions of moves on towers this tall, so it is only timed over the first
+`--legacy-moves` moves, and its time for every move is extrapolated from that.
+
+Usage:
+
+    python benchmark_moves.py
+    python benchmark_moves.py --crates 200000 --moves 1000000 --legacy-moves 5000
+
+"""
+import argparse
+import importlib.util
+import os
+import random
+import string
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def legacy_make_move(stacks: Dict[int, List[str]], move, multiple: bool = False) -> None:
+    """The original move, with the top container of each stack at the start of its list."""
+    new_containers = stacks[move.start][:move.count]
+    if not multiple:
+        new_containers = new_containers[::-1]
+    stacks[move.stop] = new_containers + stacks[move.stop]
+    stacks[move.start] = stacks[move.start][move.count:]
+
+
+def generate(seed: int, n_stacks: int, crates: int, n_moves: int, max_count: int):
+    """Random towers (top at the end of each list) holding `crates` in total, and valid moves.
+
+    Moves are given as `(count, start, stop)` tuples.
+
+    """
+    rng = random.Random(seed)
+    stacks = defaultdict(list)
+    for _ in range(crates):
+        stacks[rng.randint(1, n_stacks)].append(rng.choice(string.ascii_uppercase))
+    heights = {i: len(stacks[i]) for i in range(1, n_stacks + 1)}
+
+    moves = []
+    for _ in range(n_moves):
+        start = rng.choice([i for i, height in heights.items() if height])
+        stop = rng.choice([i for i in heights if i != start])
+        count = rng.randint(1, min(max_count, heights[start]))
+        heights[start] -= count
+        heights[stop] += count
+        moves.append((count, start, stop))
+    return stacks, moves
+
+
+def time_moves(make_move: Callable, stacks, moves, multiple: bool) -> float:
+    """Time making every move, in seconds."""
+    start = time.perf_counter()
+    for move in moves:
+        make_move(stacks, move, multiple)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--crates", type=int, default=100_000, help="Crates across all stacks.")
+    parser.add_argument("--moves", type=int, default=1_000_000, help="Moves to make.")
+    parser.add_argument(
+        "--legacy-moves", type=int, default=10_000, help="Moves to time the original over."
+    )
+    parser.add_argument("--max-count", type=int, default=3, help="Most crates in a single move.")
+    parser.add_argument("--stacks", type=int, default=9, help="Number of stacks.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    spec = importlib.util.spec_from_file_location("day_05", os.path.join(DIRECTORY, "solution.py"))
+    solution = importlib.util.module_from_spec(spec)
+    # Register before executing, as dataclasses look their module up in sys.modules
+    sys.modules[spec.name] = solution
+    spec.loader.exec_module(solution)
+    SupplyStack = solution.SupplyStack
+
+    stacks, moves = generate(args.seed, args.stacks, args.crates, args.moves, args.max_count)
+    moves = [solution.Move(*move) for move in moves]
+    legacy_moves = moves[:args.legacy_moves]
+    print(f"{args.crates} crates across {args.stacks} stacks, {len(moves)} moves")
+    print(f"{'Crane':<10}{'version':<12}{'moves':>10}{'time (s)':>11}{'per move (us)':>15}")
+
+    for multiple in (False, True):
+        crane = "9001" if multiple else "9000"
+        top_at_end = SupplyStack(stacks = defaultdict(list, {i: s[:] for i, s in stacks.items()}))
+        # The original keeps the top of each stack first, so reverse each stack for it
+        top_first = {i: stack[::-1] for i, stack in stacks.items()}
+
+        legacy = time_moves(legacy_make_move, top_first, legacy_moves, multiple)
+        prefix = time_moves(SupplyStack.make_move, top_at_end, legacy_moves, multiple)
+        # Check both versions agree before carrying on through the rest of the moves
+        if any(top_first[i] != stack[::-1] for i, stack in top_at_end.stacks.items()):
+            raise AssertionError("Both versions should give identical stacks.")
+        rest = time_moves(SupplyStack.make_move, top_at_end, moves[len(legacy_moves):], multiple)
+
+        for version, n_moves, duration in (
+            ("original", len(legacy_moves), legacy),
+            ("top-at-end", len(moves), prefix + rest),
+        ):
+            per_move = duration / max(n_moves, 1) * 1e6
+            print(f"{crane:<10}{version:<12}{n_moves:>10}{duration:>11.3f}{per_move:>15.2f}")
+        estimate = legacy / max(len(legacy_moves), 1) * len(moves)
+        print(f"{'':<10}original estimated at {estimate:.1f}s for all {len(moves)} moves")
+
+
+if __name__ == "__main__":
+    main()
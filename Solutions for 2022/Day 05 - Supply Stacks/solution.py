@@ -1,12 +1,13 @@
 """Solution for day 5 - Supply Stacks."""
 from __future__ import annotations
 
-import copy
 import os
+import random
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, NamedTuple, Tuple
+from itertools import dropwhile, takewhile
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 EXAMPLE_INPUT = """
     [D]
@@ -19,6 +20,13 @@ move 3 from 1 to 3
 move 2 from 2 to 1
 move 1 from 1 to 2
 """
+# Once moves average at least this many crates, stacks are switched over to ropes (see
+# `CrateRope`), with the average weighting the most recent moves by `MOVE_COUNT_SMOOTHING`. While
+# every stack is a list, only moves of at least this many crates update the average
+ROPE_MIN_COUNT = 8192
+MOVE_COUNT_SMOOTHING = 1 / 64
+# Number of crates held together in each chunk of a newly built rope
+ROPE_CHUNK_SIZE = 64
 
 
 class Move(NamedTuple):
@@ -27,34 +35,259 @@ class Move(NamedTuple):
     stop: int
 
 
+class _Node:
+    """A chunk of crates within a `CrateRope`, at the root of the subtree of chunks around it."""
+
+    __slots__ = ("crates", "priority", "size", "left", "right", "reversed")
+
+    def __init__(self, crates: List[str], priority: float):
+        self.crates = crates
+        self.priority = priority
+        # Total number of crates in this subtree
+        self.size = len(crates)
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        # Whether the order of this subtree is yet to be reversed
+        self.reversed = False
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node else 0
+
+
+def _update(node: _Node) -> None:
+    node.size = _size(node.left) + len(node.crates) + _size(node.right)
+
+
+def _push(node: _Node) -> None:
+    """Apply a pending reversal of the node's subtree, passing it down to its children."""
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        node.crates.reverse()
+        for child in (node.left, node.right):
+            if child:
+                child.reversed = not child.reversed
+        node.reversed = False
+
+
+def _split(node: Optional[_Node], count: int) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split the subtree into its first `count` crates and the rest."""
+    if node is None:
+        return None, None
+    _push(node)
+    left_size = _size(node.left)
+    if count <= left_size:
+        left, node.left = _split(node.left, count)
+        _update(node)
+        return left, node
+    if count >= left_size + len(node.crates):
+        node.right, right = _split(node.right, count - left_size - len(node.crates))
+        _update(node)
+        return node, right
+    # Split falls within this node's chunk, so split the chunk in two, with the second half taking
+    # this node's priority so it can sit above the crates to its right
+    count -= left_size
+    right = _Node(node.crates[count:], node.priority)
+    del node.crates[count:]
+    right.right, node.right = node.right, None
+    _update(right)
+    _update(node)
+    return node, right
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Join two subtrees, with every crate of the left one before every crate of the right one."""
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        _push(left)
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    _push(right)
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+class CrateRope:
+    """A stack of crates (bottom first, like the lists in `SupplyStack`) stored as a rope.
+
+    The crates are held in chunks, which form a binary tree ordered by their position in the stack
+    (a treap), kept balanced (with high probability) by giving each chunk a random priority and
+    keeping higher priorities above lower ones. Splitting off the top of the stack or placing crates
+    on top of it then takes O(log n + chunk size) time however many crates are moved, and reversing
+    the order of crates is a lazy flag which is only pushed down the tree as it is walked.
+
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: Optional[_Node] = None):
+        self.root = root
+
+    @classmethod
+    def from_list(cls, crates: List[str]) -> CrateRope:
+        """Build a rope from a list of crates (bottom first) in O(n) time."""
+        # Build the tree left to right, keeping the rightmost path of the tree on a stack
+        rightmost: List[_Node] = []
+        for start in range(0, len(crates), ROPE_CHUNK_SIZE):
+            node = _Node(crates[start:start + ROPE_CHUNK_SIZE], random.random())
+            last = None
+            while rightmost and rightmost[-1].priority < node.priority:
+                last = rightmost.pop()
+            node.left = last
+            if rightmost:
+                rightmost[-1].right = node
+            rightmost.append(node)
+        rope = cls(rightmost[0] if rightmost else None)
+        # Each subtree's size is needed before its parent's, so work back from the end
+        for node in reversed(list(rope._nodes())):
+            _update(node)
+        return rope
+
+    def _nodes(self) -> Iterator[_Node]:
+        """Every node in the tree, each before its children."""
+        nodes = [self.root] if self.root else []
+        while nodes:
+            node = nodes.pop()
+            yield node
+            nodes.extend(child for child in (node.left, node.right) if child)
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __iter__(self) -> Iterator[str]:
+        """Crates in order from the bottom of the stack to the top."""
+        path, node = [], self.root
+        while path or node:
+            if node:
+                _push(node)
+                path.append(node)
+                node = node.left
+            else:
+                node = path.pop()
+                yield from node.crates
+                node = node.right
+
+    def __getitem__(self, index: int) -> str:
+        """Crate at the given position in the stack (negative positions count from the top)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CrateRope index out of range")
+        node = self.root
+        while True:
+            _push(node)
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + len(node.crates):
+                return node.crates[index - left_size]
+            else:
+                index -= left_size + len(node.crates)
+                node = node.right
+
+    def copy(self) -> CrateRope:
+        return CrateRope.from_list(list(self))
+
+    def take_top(self, count: int) -> CrateRope:
+        """Remove the top `count` crates from the stack, returning them as their own rope."""
+        self.root, top = _split(self.root, len(self) - count)
+        return CrateRope(top)
+
+    def reverse(self) -> None:
+        if self.root:
+            self.root.reversed = not self.root.reversed
+
+    def extend(self, other: CrateRope) -> None:
+        """Place every crate of the other rope on top of this stack, emptying the other rope."""
+        self.root = _merge(self.root, other.root)
+        other.root = None
+
+
 @dataclass
 class SupplyStack:
-    stacks: Dict[int, List[int]]
+    stacks: Dict[int, Union[List[str], CrateRope]]
+    mean_move_count: float = 0
+    # Whether any of the stacks have been switched over to ropes
+    has_ropes: bool = False
 
     @classmethod
     def from_raw(cls, raw_stacks: str) -> SupplyStack:
-        # Unpack all rows except last into list of lists
+        return cls.from_rows(raw_stacks.splitlines())
+
+    @classmethod
+    def from_rows(cls, rows: List[str]) -> SupplyStack:
+        # Unpack all rows except last into list of lists, from the bottom row up so that the top
+        # container of each stack is at the end of its list
         stacks = defaultdict(list)
-        for row in raw_stacks.splitlines()[:-1]:
+        for row in reversed(rows[:-1]):
             for match in re.finditer("\w+", row):
                 stacks[1 + match.start() // 4].append(match.group())
         return cls(stacks = stacks)
 
+    def snapshot(self) -> SupplyStack:
+        # Copy each stack's containers, sharing the (immutable) container codes themselves
+        stacks = defaultdict(list, {i: stack.copy() for i, stack in self.stacks.items()})
+        return SupplyStack(
+            stacks = stacks, mean_move_count = self.mean_move_count, has_ropes = self.has_ropes
+        )
+
     def make_move(self, move: Move, multiple: bool = False) -> None:
-        # Reverse the removed containers and combine with existing containers
-        new_containers = self.stacks[move.start][:move.count]
+        # Small moves between lists are by far the most common, so keep them to the bare minimum
+        if self.has_ropes or move.count >= ROPE_MIN_COUNT:
+            self._make_large_move(move, multiple)
+            return
+        start_stack = self.stacks[move.start]
+        stop_stack = self.stacks[move.stop]
+
+        # The top of each stack is the end of its list, so only the moved containers are touched
+        new_containers = start_stack[len(start_stack) - move.count:]
+        # Remove from previous stack index
+        del start_stack[len(start_stack) - move.count:]
         if not multiple:
             # If crane cannot move multiple containers, move individually & reverse the order
-            new_containers = new_containers[::-1]
-        self.stacks[move.stop] = new_containers + self.stacks[move.stop]
-        # Remove from previous stack index
-        self.stacks[move.start] = self.stacks[move.start][move.count:]
+            new_containers.reverse()
+        stop_stack.extend(new_containers)
+
+    def _make_large_move(self, move: Move, multiple: bool) -> None:
+        # Moving lots of containers is quicker with ropes, but moving a few is quicker with lists,
+        # so switch between them based on how many containers are typically being moved
+        self.mean_move_count += (move.count - self.mean_move_count) * MOVE_COUNT_SMOOTHING
+        if self.mean_move_count >= ROPE_MIN_COUNT:
+            self.has_ropes = True
+            self._make_rope_move(move, multiple)
+            return
+        for i in (move.start, move.stop):
+            if isinstance(self.stacks[i], CrateRope):
+                self.stacks[i] = list(self.stacks[i])
+                self.has_ropes = any(
+                    isinstance(stack, CrateRope) for stack in self.stacks.values()
+                )
+        start_stack = self.stacks[move.start]
+        new_containers = start_stack[len(start_stack) - move.count:]
+        del start_stack[len(start_stack) - move.count:]
+        if not multiple:
+            new_containers.reverse()
+        self.stacks[move.stop].extend(new_containers)
+
+    def _make_rope_move(self, move: Move, multiple: bool) -> None:
+        # Switch both stacks over to ropes, so the move takes O(log n) time however many it moves
+        for i in (move.start, move.stop):
+            if not isinstance(self.stacks[i], CrateRope):
+                self.stacks[i] = CrateRope.from_list(self.stacks[i])
+        new_containers = self.stacks[move.start].take_top(move.count)
+        if not multiple:
+            # If crane cannot move multiple containers, move individually & reverse the order
+            new_containers.reverse()
+        self.stacks[move.stop].extend(new_containers)
 
     def get_top_containers(self) -> str:
         result = ""
         # Iterate through containers and pick off the top container code
         for i in range(1, max(self.stacks.keys()) + 1):
-            result += self.stacks[i][0] if self.stacks[i] else " "
+            result += self.stacks[i][-1] if self.stacks[i] else " "
         return result
 
 
@@ -65,33 +298,168 @@ def _parse_input(data: List[str]) -> Tuple[SupplyStack, List[Move]]:
 
     # Load into associated objects
     stack = SupplyStack.from_raw(stack_raw)
-    moves = [Move(*map(int, re.findall(r"\d+", move))) for move in moves_raw.splitlines()]
+    moves = _parse_moves(moves_raw.splitlines())
     return stack, moves
 
 
-def solution_part_1(stacks: SupplyStack, moves: List[Move]) -> str():
-    """Solution to Part 1."""
+def _parse_input_streaming(path: str) -> Tuple[SupplyStack, List[Move]]:
+    """Parse input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    # Stack drawing runs until the first blank line, with the move list following it
+    lines = dropwhile(lambda line: not line, iter_lines(path))
+    stack = SupplyStack.from_rows(list(takewhile(bool, lines)))
+    moves = _parse_moves(line for line in lines if line)
+    return stack, moves
+
+
+def _parse_moves(moves_raw: Iterable[str]) -> List[Move]:
+    """Parse each line of the move list into a Move."""
+    return [Move(*map(int, re.findall(r"\d+", move))) for move in moves_raw]
+
+
+class OptimiseStats(NamedTuple):
+    """How much shorter a list of moves was made by `optimise_moves`."""
+
+    original: int
+    optimised: int
+    fused: int
+    cancelled: int
+
+    def report(self) -> str:
+        removed = self.original - self.optimised
+        return (
+            f"{self.original} moves optimised to {self.optimised} ({removed} removed: "
+            f"{self.fused} fused into the previous move, {self.cancelled} cancelled out)"
+        )
+
+
+def optimise_moves(moves: List[Move], multiple: bool = False) -> Tuple[List[Move], OptimiseStats]:
+    """Shorten a list of moves by fusing and cancelling moves, without changing their outcome.
+
+    Moves are compared with the previous move kept (after any earlier fusing and cancelling), so
+    that cancelling a pair of moves can expose further moves to fuse or cancel.
+
+    - A crane moving one container at a time (`multiple=False`) makes the same moves of single
+      containers whether moving 2 and then 3 containers between the same two stacks, or moving 5.
+      Moving containers back along the same pair of stacks undoes the most recent of those single
+      moves, so consecutive moves between the same pair of stacks fuse into their net move.
+    - A crane moving multiple containers at once (`multiple=True`) keeps their order, so moving
+      some containers and then the next ones beneath them puts them in a different order to
+      moving them all at once, and only moves immediately moved straight back cancel out.
+
+    Moves of no containers are dropped.
+
+    """
+    optimised: List[Move] = []
+    fused = cancelled = 0
+    for move in moves:
+        if move.count == 0:
+            cancelled += 1
+            continue
+        last = optimised[-1] if optimised else None
+        if last and {last.start, last.stop} == {move.start, move.stop}:
+            # Net number of containers moved along the last move's direction
+            net = last.count + (move.count if last.start == move.start else -move.count)
+            if net == 0:
+                optimised.pop()
+                cancelled += 2
+                continue
+            if not multiple:
+                optimised.pop()
+                if last.start == move.start:
+                    fused += 1
+                else:
+                    cancelled += 1
+                optimised.append(
+                    Move(net, last.start, last.stop) if net > 0 else
+                    Move(-net, last.stop, last.start)
+                )
+                continue
+        optimised.append(move)
+    return optimised, OptimiseStats(len(moves), len(optimised), fused, cancelled)
+
+
+def solution_part_1(stacks: SupplyStack, moves: List[Move], optimise: bool = False) -> str():
+    """Solution to Part 1, optionally optimising the moves first (see `optimise_moves`)."""
+    if optimise:
+        moves, _ = optimise_moves(moves, multiple=False)
     # Iterate through moves and re-order the stacks appropriately
     for move in moves:
         stacks.make_move(move, multiple=False)
     return stacks.get_top_containers()
 
 
-def solution_part_2(stacks: SupplyStack, moves: List[Move]) -> str:
-    """Solution to Part 2."""
+def solution_part_2(stacks: SupplyStack, moves: List[Move], optimise: bool = False) -> str:
+    """Solution to Part 2, optionally optimising the moves first (see `optimise_moves`)."""
+    if optimise:
+        moves, _ = optimise_moves(moves, multiple=True)
     # Iterate through moves and re-order the stacks appropriately
     for move in moves:
         stacks.make_move(move, multiple=True)
     return stacks.get_top_containers()
 
 
+def solution_both_parts(stacks: SupplyStack, moves: List[Move]) -> Tuple[str, str]:
+    """Solution to both parts, each run on its own snapshot of the stacks."""
+    return solution_part_1(stacks.snapshot(), moves), solution_part_2(stacks.snapshot(), moves)
+
+
+def solution_top_only(stacks: SupplyStack, moves: List[Move], multiple: bool = False) -> str:
+    """Solution to either part, tracing each final top container back to where it started.
+
+    Rather than moving every container, only the position of each stack's final top container is
+    followed, backwards through the moves, as its depth below the top of a stack. Undoing a move
+    takes a container on its destination stack either back to its origin stack (if it was one of
+    the containers moved) or further down its destination stack, while a container left on the
+    origin stack was that much further down before the move.
+
+    This takes O(moves x stacks) time, and needs no more memory than the moves themselves, however
+    many containers there are. The original stacks are only read, never changed.
+
+    """
+    n_stacks = max(stacks.stacks.keys())
+    # Work out which stacks end up empty, as they have no top container to trace
+    heights = {i: len(stacks.stacks[i]) for i in range(1, n_stacks + 1)}
+    for move in moves:
+        heights[move.start] -= move.count
+        heights[move.stop] += move.count
+
+    # Position of each final top container, as (stack, depth below the top)
+    positions = {i: (i, 0) for i in range(1, n_stacks + 1) if heights[i]}
+    for move in reversed(moves):
+        for i, (stack, depth) in positions.items():
+            if stack == move.stop:
+                if depth >= move.count:
+                    # Wasn't moved, but the moved containers were placed above it
+                    positions[i] = (stack, depth - move.count)
+                elif multiple:
+                    positions[i] = (move.start, depth)
+                else:
+                    # Crane moves one at a time, so reversed the order of the moved containers
+                    positions[i] = (move.start, move.count - 1 - depth)
+            elif stack == move.start:
+                # The moved containers were above it
+                positions[i] = (stack, depth + move.count)
+
+    result = ""
+    for i in range(1, n_stacks + 1):
+        if i in positions:
+            stack, depth = positions[i]
+            result += stacks.stacks[stack][-1 - depth]
+        else:
+            result += " "
+    return result
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
     example_stacks, example_moves = _parse_input(EXAMPLE_INPUT)
     print("Results for given example:")
-    print("Part 1:", solution_part_1(copy.deepcopy(example_stacks), example_moves))
-    print("Part 2:", solution_part_2(copy.deepcopy(example_stacks), example_moves))
+    part_1, part_2 = solution_both_parts(example_stacks, example_moves)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
     # Load local data file
     with open(os.path.join(os.path.dirname(__file__), "data.txt"), "r", encoding="utf-8") as f:
@@ -99,5 +467,11 @@ if __name__ == "__main__":
 
     # Execute solution for solution part 1 & 2
     print("\nResults for full puzzle data:")
-    print("Part 1:", solution_part_1(copy.deepcopy(stacks), moves))
-    print("Part 2:", solution_part_2(copy.deepcopy(stacks), moves))
+    part_1, part_2 = solution_both_parts(stacks, moves)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
+
+    # Report how far the moves could be shortened for each crane, before replaying them
+    print("\nMove optimisation for full puzzle data:")
+    print("CrateMover 9000:", optimise_moves(moves, multiple=False)[1].report())
+    print("CrateMover 9001:", optimise_moves(moves, multiple=True)[1].report())
@@ -1,6 +1,7 @@
 """Solution for day 6 - Tuning Trouble."""
+import functools
 import os
-from typing import List
+from typing import Dict, Iterable, List, Optional, Union
 
 EXAMPLE_INPUT = """
 mjqjpqmgbljsphdztnvjfqwrcgsmlb
@@ -12,7 +13,14 @@ def _parse_input(data: str) -> str:
     return data.strip()
 
 
-def solution(datastream: str, buffer_size: int) -> int:
+def _parse_input_streaming(path: str) -> bytes:
+    """Read input data file as bytes, copying its contents just once."""
+    from aoc.loader import read_stripped
+
+    return read_stripped(path)
+
+
+def solution(datastream: Union[str, bytes], buffer_size: int) -> int:
     """Solution to both parts."""
     # O(n) - Trawl through datastream and check the trailing buffer_size characters
     for idx in range(buffer_size, len(datastream) + 1):
@@ -23,6 +31,138 @@ def solution(datastream: str, buffer_size: int) -> int:
     raise Exception("No marker detected!")
 
 
+def solution_scan(datastream: Union[str, bytes, memoryview], buffer_size: int) -> int:
+    """Solution to both parts, doing a constant amount of work per character.
+
+    Rather than checking every window of `buffer_size` characters in full, keep track of where
+    each character was last seen, and of the start of the current run of unique characters. On
+    seeing a character already within the current run, the run can only restart just after its
+    last sighting, skipping every window in between. The marker is found once the current run is
+    `buffer_size` long.
+
+    Works on text or raw bytes, including a `memoryview` (e.g. of a memory-mapped file).
+
+    """
+    last_seen = {}
+    run_start = 0
+    for idx, character in enumerate(datastream):
+        previous = last_seen.get(character, -1)
+        if previous >= run_start:
+            run_start = previous + 1
+        last_seen[character] = idx
+        if idx - run_start + 1 == buffer_size:
+            return idx + 1
+    raise Exception("No marker detected!")
+
+
+def scan_markers(
+    datastream: Union[bytes, memoryview],
+    buffer_sizes: Iterable[int],
+    first_only: bool = True,
+    start: int = 0,
+) -> Dict[int, List[int]]:
+    """Find the markers for several buffer sizes at once, in a single scan over raw bytes.
+
+    As in `solution_scan`, the length of the current run of unique characters is tracked at each
+    position. A window of any size ending at that position is unique if the run is at least that
+    long, so every buffer size is checked from the one run length. Returns the markers found for
+    each buffer size, in order, stopping at the first for each if `first_only`.
+
+    Only markers ending at or after the `start` index are reported, with the bytes before it only
+    used to look back over, e.g. the overlap shared with the previous chunk of a larger stream.
+
+    """
+    remaining = sorted(set(buffer_sizes))
+    markers = {buffer_size: [] for buffer_size in remaining}
+    last_seen = [-1] * 256
+    run_start = 0
+    for idx, character in enumerate(datastream):
+        previous = last_seen[character]
+        if previous >= run_start:
+            run_start = previous + 1
+        last_seen[character] = idx
+        if idx < start:
+            continue
+
+        run = idx - run_start + 1
+        # Buffer sizes are in ascending order, so stop at the first the run is too short for
+        for buffer_size in remaining:
+            if buffer_size > run:
+                break
+            markers[buffer_size].append(idx + 1)
+        if first_only and run >= remaining[0]:
+            remaining = [buffer_size for buffer_size in remaining if not markers[buffer_size]]
+            if not remaining:
+                break
+    return markers
+
+
+def _scan_file_chunk(
+    path: str, buffer_sizes: List[int], first_only: bool, start: int, stop: int
+) -> Dict[int, List[int]]:
+    """Find the markers ending within start:stop of the file, looking back as far as needed."""
+    from aoc.loader import mapped_file
+
+    lookback = min(start, max(buffer_sizes) - 1)
+    with mapped_file(path) as data:
+        chunk = data[start - lookback:stop]
+    markers = scan_markers(chunk, buffer_sizes, first_only, start=lookback)
+    # Positions are relative to the start of the chunk, including the look back
+    offset = start - lookback
+    return {
+        buffer_size: [marker + offset for marker in chunk_markers]
+        for buffer_size, chunk_markers in markers.items()
+    }
+
+
+def scan_file_markers(
+    path: str,
+    buffer_sizes: Iterable[int],
+    first_only: bool = True,
+    workers: Optional[int] = None,
+    chunk_size: int = 1 << 24,
+) -> Dict[int, List[int]]:
+    """Find the markers for several buffer sizes in a (potentially huge) file, in parallel.
+
+    The file is split into chunks of `chunk_size` bytes, each scanned in a pool of processes along
+    with the `max(buffer_sizes) - 1` bytes before it, so that every window is seen in full by the
+    chunk it ends in. The results match a single `scan_markers` over the whole file exactly. Any
+    trailing line ending is ignored, as with `_parse_input`.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from aoc.loader import mapped_file
+
+    buffer_sizes = sorted(set(buffer_sizes))
+    with mapped_file(path) as data:
+        length = len(data)
+        while length and data[length - 1:length] in (b"\n", b"\r"):
+            length -= 1
+        # Not worth starting a pool of processes for a single chunk
+        if length <= chunk_size:
+            return scan_markers(data[:length], buffer_sizes, first_only)
+
+    markers = {buffer_size: [] for buffer_size in buffer_sizes}
+    scan_chunk = functools.partial(_scan_file_chunk, path, buffer_sizes, first_only)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(scan_chunk, start, min(start + chunk_size, length))
+            for start in range(0, length, chunk_size)
+        ]
+        # Merge the results in order, so that the first marker found is the earliest
+        for future in futures:
+            for buffer_size, chunk_markers in future.result().items():
+                if not (first_only and markers[buffer_size]):
+                    markers[buffer_size].extend(chunk_markers)
+            if first_only and all(markers.values()):
+                # Every first marker has been found, so skip any chunks yet to be scanned
+                for remaining in futures:
+                    remaining.cancel()
+                break
+    return markers
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import os
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 EXAMPLE_INPUT = """
 $ cd /
@@ -34,39 +35,14 @@ $ ls
 
 @dataclass
 class Directory:
-    """Linked list representation of a file directory."""
+    """Class object representing a directory listed within a directory."""
 
     name: str
-    size: int = 0
-    parent: Optional[Directory] = None
-    children: Dict[str, Directory] = field(default_factory=dict)
-
-    def _get_abs_path(self):
-        """Get absolute path to this directory."""
-        if self.name == "/":
-            return self.name
-        # Walk up through tree to build abs path to this dir
-        path = self.name
-        tmp_dir = self.parent
-        while tmp_dir.name != "/":
-            print(tmp_dir.name)
-            path = f"/{tmp_dir.name}" + path
-            tmp_dir = tmp_dir.parent
-        return path
-
-    def __hash__(self) -> str:
-        """Make this hashable so it can be added to a set later."""
-        # List also happens to work ofc in terminal.directories, but a set is better.
-        return hash((self.parent.__hash__() if self.parent else None, self.name))
-
-    def __eq__(self, other: Directory) -> bool:
-        """Utility method to check directory equality for adding to set."""
-        return self._get_abs_path() == other._get_abs_path()
 
 
 @dataclass
 class File:
-    """Class object representing a directory within a file."""
+    """Class object representing a file within a directory."""
 
     size: int
     name: str
@@ -104,76 +80,326 @@ class Execution:
 
 @dataclass
 class Terminal:
-    """Instance of a terminal shell, which can navigate directories."""
+    """Instance of a terminal shell, which can navigate directories.
 
-    root_dir: Directory
-    current_directory: Directory
-    directories: Set[Directory]
+    The file system is stored as a compact tree of flat arrays, indexed by integer directory IDs
+    handed out in the order directories are first listed, with the root directory as 0. As each
+    directory is listed before any of its children, every child has a greater ID than its parent.
+
+    """
+
+    names: List[str] = field(default_factory=lambda: ["/"])
+    parents: List[int] = field(default_factory=lambda: [-1])
+    children: List[Dict[str, int]] = field(default_factory=lambda: [{}])
+    # Total size of the files directly within each directory
+    file_sizes: List[int] = field(default_factory=lambda: [0])
+    # Total size of each directory, including subdirectories, filled in by `compute_sizes`
+    sizes: List[int] = field(default_factory=list)
+    current_directory: int = 0
 
     def cd(self, execution: Execution) -> None:
         """Execute a cd operation."""
         # Change directory either one level up or into a new child dir
         if execution.argument == "..":
-            self.current_directory = self.current_directory.parent
+            self.current_directory = self.parents[self.current_directory]
+        elif execution.argument == "/":
+            self.current_directory = 0
         else:
             # Assumes child directories have already been constructed during ls cmd
-            self.current_directory = self.current_directory.children[execution.argument]
-            # Add to over-arching list of directories for convenience later
-            self.directories.add(self.current_directory)
+            self.current_directory = self.children[self.current_directory][execution.argument]
 
     def ls(self, execution: Execution) -> None:
         """Execute an ls operation."""
-        # Calculate directory size with new files
-        self.current_directory.size = sum(obj.size for obj in execution.response)
-
-        # Update parent dir sizes with new size
-        tmp_dir = self.current_directory
-        while tmp_dir.parent:
-            tmp_dir.parent.size += self.current_directory.size
-            tmp_dir = tmp_dir.parent
-
-        # For each directory in the response, create list link to and from this directory
+        current = self.current_directory
+        # Directory sizes are totalled up later, once all directories have been listed
+        self.file_sizes[current] = sum(
+            obj.size for obj in execution.response if isinstance(obj, File)
+        )
+
+        # For each new directory in the response, give it an ID and link it to this directory
+        children = self.children[current]
         for directory in [i for i in execution.response if isinstance(i, Directory)]:
-            self.current_directory.children[directory.name] = directory
-            directory.parent = self.current_directory
+            if directory.name not in children:
+                children[directory.name] = len(self.names)
+                self.names.append(directory.name)
+                self.parents.append(current)
+                self.children.append({})
+                self.file_sizes.append(0)
+
+    def compute_sizes(self) -> List[int]:
+        """Total up the size of every directory, including its subdirectories, in a single pass.
+
+        As every child has a greater ID than its parent, walking the IDs in reverse visits each
+        directory after all of its subdirectories (i.e. post-order), so each directory's size is
+        complete by the time it is added onto its parent's.
+
+        """
+        sizes = self.file_sizes[:]
+        parents = self.parents
+        for directory in range(len(sizes) - 1, 0, -1):
+            sizes[parents[directory]] += sizes[directory]
+        self.sizes = sizes
+        return sizes
+
+    def path(self, directory: int) -> str:
+        """Absolute path to the given directory."""
+        names = []
+        while directory > 0:
+            names.append(self.names[directory])
+            directory = self.parents[directory]
+        return "/" + "/".join(reversed(names))
+
+
+class SortedSizes:
+    """Sorted multiset of directory sizes, kept as a list of sorted blocks with their totals.
+
+    Splitting the sizes into blocks of at most `2 * block_size` means adding or removing a size
+    only shifts the sizes within a single block, rather than the whole sorted array. Keeping each
+    block's total alongside it means the sum of every size up to a threshold only adds up the
+    totals of the blocks below it, and part of a single block.
+
+    """
+
+    def __init__(self, sizes: Iterable[int], block_size: int = 512):
+        """Sort the given sizes into blocks of `block_size`."""
+        ordered = sorted(sizes)
+        self.block_size = block_size
+        self.blocks = [
+            ordered[start:start + block_size] for start in range(0, len(ordered), block_size)
+        ]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.totals = [sum(block) for block in self.blocks]
+
+    def __len__(self) -> int:
+        """Number of sizes held."""
+        return sum(len(block) for block in self.blocks)
+
+    def add(self, size: int) -> None:
+        """Add a size, splitting its block in two if it has grown too large."""
+        if not self.blocks:
+            self.blocks.append([size])
+            self.maxes.append(size)
+            self.totals.append(size)
+            return
+        index = min(bisect_left(self.maxes, size), len(self.blocks) - 1)
+        block = self.blocks[index]
+        insort(block, size)
+        self.maxes[index] = block[-1]
+        self.totals[index] += size
+        if len(block) > 2 * self.block_size:
+            half = block[self.block_size:]
+            del block[self.block_size:]
+            self.blocks.insert(index + 1, half)
+            self.maxes[index:index + 1] = [block[-1], half[-1]]
+            self.totals[index:index + 1] = [sum(block), sum(half)]
+
+    def remove(self, size: int) -> None:
+        """Remove a single occurrence of a size, raising a ValueError if it isn't held."""
+        index = bisect_left(self.maxes, size)
+        block = self.blocks[index] if index < len(self.blocks) else []
+        position = bisect_left(block, size)
+        if position == len(block) or block[position] != size:
+            raise ValueError(f"No directory of size {size}.")
+        del block[position]
+        if block:
+            self.maxes[index] = block[-1]
+            self.totals[index] -= size
+        else:
+            del self.blocks[index], self.maxes[index], self.totals[index]
+
+    def sum_at_most(self, threshold: int) -> int:
+        """Sum of every size of at most the given threshold."""
+        index = bisect_right(self.maxes, threshold)
+        total = sum(self.totals[:index])
+        if index < len(self.blocks):
+            block = self.blocks[index]
+            total += sum(block[:bisect_right(block, threshold)])
+        return total
+
+    def smallest_at_least(self, threshold: int) -> Optional[int]:
+        """Smallest size of at least the given threshold, if there is one."""
+        index = bisect_left(self.maxes, threshold)
+        if index == len(self.blocks):
+            return None
+        block = self.blocks[index]
+        return block[bisect_left(block, threshold)]
+
+    def largest(self, count: int) -> List[int]:
+        """The `count` largest sizes, largest first."""
+        largest = []
+        for block in reversed(self.blocks):
+            if len(largest) >= count:
+                break
+            largest.extend(reversed(block[-(count - len(largest)):]))
+        return largest
+
+
+class DirectorySizeIndex:
+    """Index over a replayed terminal's file system, answering directory size queries.
+
+    Directories are laid out in Euler tour (pre-order) order, such that each directory's subtree is
+    the contiguous range `entry[d]:exit[d]`. A Fenwick tree holds the size of the files directly
+    within each directory at its entry position, so any directory's size is a range sum found in
+    O(log n), and changing a file is a single O(log n) point update.
+
+    Threshold queries run against `SortedSizes`, a sorted multiset of every directory's size,
+    which is kept up to date as files change by moving each ancestor's size to its new place.
+    Each change therefore costs O(depth * (log n + block size)), with no rebuild on the next
+    query, so updates and queries can be freely interleaved.
+
+    """
+
+    def __init__(self, terminal: Terminal):
+        """Index the file system of the given terminal, which is left untouched."""
+        parents = terminal.parents
+        n = len(parents)
+        self.parents = parents[:]
+
+        # Count the directories in each subtree, children always having greater IDs than parents
+        subtree_counts = [1] * n
+        for directory in range(n - 1, 0, -1):
+            subtree_counts[parents[directory]] += subtree_counts[directory]
+        # Lay each directory's children out one subtree after another, directly after it
+        self.entry = entry = [0] * n
+        for directory in range(n):
+            position = entry[directory] + 1
+            for child in terminal.children[directory].values():
+                entry[child] = position
+                position += subtree_counts[child]
+        self.exit = [entry[directory] + subtree_counts[directory] for directory in range(n)]
+
+        # Build the Fenwick tree in O(n), pushing each node's total up to its parent node
+        self.tree = tree = [0] * (n + 1)
+        for directory, size in enumerate(terminal.file_sizes):
+            tree[entry[directory] + 1] = size
+        for position in range(1, n + 1):
+            parent = position + (position & -position)
+            if parent <= n:
+                tree[parent] += tree[position]
+
+        # Total up each directory's size, as in `Terminal.compute_sizes`
+        sizes = terminal.file_sizes[:]
+        for directory in range(n - 1, 0, -1):
+            sizes[parents[directory]] += sizes[directory]
+        self.sorted_sizes = SortedSizes(sizes)
+
+    def _prefix_sum(self, position: int) -> int:
+        """Total size of the files in the first `position` directories of the Euler tour."""
+        tree = self.tree
+        total = 0
+        while position:
+            total += tree[position]
+            position &= position - 1
+        return total
+
+    def size(self, directory: int) -> int:
+        """Total size of the given directory, including its subdirectories."""
+        return self._prefix_sum(self.exit[directory]) - self._prefix_sum(self.entry[directory])
+
+    def add_file(self, directory: int, size: int) -> None:
+        """Add a file of the given size directly within the given directory."""
+        if not size:
+            return
+        # Move the size of the directory and each of its ancestors to its new place
+        sorted_sizes = self.sorted_sizes
+        ancestor = directory
+        while ancestor >= 0:
+            old_size = self.size(ancestor)
+            sorted_sizes.remove(old_size)
+            sorted_sizes.add(old_size + size)
+            ancestor = self.parents[ancestor]
+
+        tree = self.tree
+        position = self.entry[directory] + 1
+        while position < len(tree):
+            tree[position] += size
+            position += position & -position
+
+    def remove_file(self, directory: int, size: int) -> None:
+        """Remove a file of the given size from directly within the given directory."""
+        self.add_file(directory, -size)
+
+    def resize_file(self, directory: int, old_size: int, new_size: int) -> None:
+        """Change the size of a file directly within the given directory."""
+        self.add_file(directory, new_size - old_size)
+
+    def sum_at_most(self, threshold: int) -> int:
+        """Sum of the sizes of every directory of at most the given size."""
+        return self.sorted_sizes.sum_at_most(threshold)
+
+    def smallest_at_least(self, threshold: int) -> Optional[int]:
+        """Size of the smallest directory of at least the given size, if there is one."""
+        return self.sorted_sizes.smallest_at_least(threshold)
+
+    def largest(self, count: int) -> List[int]:
+        """Sizes of the `count` largest directories, largest first."""
+        return self.sorted_sizes.largest(count)
 
 
 def _parse_input(data: str) -> Terminal:
     """Parse input data into a more malleable format."""
     # Create new terminal at root directory
-    root_dir = Directory("/")
-    terminal = Terminal(root_dir=root_dir, current_directory=root_dir, directories={root_dir})
+    terminal = Terminal()
 
     # Walk through the input and load into Executions
-    executions = []
     for execution_raw in data.strip().split("$ ")[2:]:  # Skip two items ("" and "cd /")
         # Build execution including response
         full_cmd, full_resp = execution_raw.split("\n", 1)
         execution = Execution(*full_cmd.strip().split(), response=full_resp.splitlines())
         # Execute on the terminal
         getattr(terminal, execution.command)(execution)
+    terminal.compute_sizes()
+    return terminal
+
+
+def _parse_input_streaming(path: str) -> Terminal:
+    """Replay input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    # Create new terminal at root directory
+    terminal = Terminal()
+
+    # Walk through the input, skipping the initial "cd /", and execute on the terminal
+    executions = _iter_executions(iter_lines(path))
+    next(executions, None)
+    for execution in executions:
+        getattr(terminal, execution.command)(execution)
+    terminal.compute_sizes()
     return terminal
 
 
+def _iter_executions(lines: Iterable[str]) -> Iterator[Execution]:
+    """Group lines of terminal output into Executions of each command along with its response."""
+    full_cmd, full_resp = None, []
+    for line in lines:
+        if line.startswith("$ "):
+            if full_cmd is not None:
+                yield Execution(*full_cmd.split(), response=full_resp)
+            full_cmd, full_resp = line[2:], []
+        elif line:
+            full_resp.append(line)
+    if full_cmd is not None:
+        yield Execution(*full_cmd.split(), response=full_resp)
+
+
 def solution_part_1(terminal: Terminal) -> int:
     """Solution to Part 1 - Add up all directories < 1MB."""
-    return sum(i.size for i in terminal.directories if i.size <= 100_000)
+    return sum(size for size in terminal.sizes if size <= 100_000)
 
 
 def solution_part_2(terminal: Terminal) -> int:
     """Solution to Part 2."""
     # Calculate space required
-    available_space = 70_000_000 - terminal.root_dir.size
+    available_space = 70_000_000 - terminal.sizes[0]
     space_to_free_up = 30_000_000 - available_space
     # Find smallest directory that can be deleted to create required space
     if space_to_free_up < 0:
         return -1
-    return min(i.size for i in terminal.directories if i.size >= space_to_free_up)
+    return min(size for size in terminal.sizes if size >= space_to_free_up)
 
 
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
-    print(Directory(1, None))
     # Print solutions to example in the problem brief
     example_terminal = _parse_input(EXAMPLE_INPUT)
     print("Results for given example:")
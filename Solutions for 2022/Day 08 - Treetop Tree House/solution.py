@@ -1,7 +1,12 @@
 """Solution for day 8 - Treetop Tree House."""
+from __future__ import annotations
+
 import os
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import TYPE_CHECKING, Iterator, List
+
+if TYPE_CHECKING:
+    from aoc.grid import Grid
 
 EXAMPLE_INPUT = """
 30373
@@ -10,6 +15,8 @@ EXAMPLE_INPUT = """
 33549
 35390
 """
+# Translation table converting digit characters to their values
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
 
 @dataclass
@@ -26,6 +33,13 @@ def _parse_input(data: List[str]) -> List[List[int]]:
     return [list(map(int, list(i))) for i in data.strip().splitlines()]
 
 
+def _parse_input_streaming(path: str) -> List[List[int]]:
+    """Parse input data file one row at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    return [list(map(int, line)) for line in iter_lines(path) if line]
+
+
 def calculate_biggest_trees(tree_heights: List[List[int]]) -> List[List[Tree]]:
     """Enrich the tree heights data to enable true O(n^2) solution.
 
@@ -139,6 +153,66 @@ def solution_part_2(tree_heights: List[List[int]]) -> int:
     return max(scenic_scores)
 
 
+def _parse_input_grid(data: str) -> Grid:
+    """Parse input data into a compact Grid of tree heights, one byte per tree."""
+    from aoc.grid import Grid
+
+    return Grid.from_lines(data.strip().splitlines(), table=DIGITS)
+
+
+def _grid_lines(grid: Grid) -> Iterator[range]:
+    """Flat indexes along every row and column of the grid, walked in both directions."""
+    for row_idx in range(grid.height):
+        start = row_idx * grid.width
+        yield range(start, start + grid.width)
+        yield range(start + grid.width - 1, start - 1, -1)
+    for col_idx in range(grid.width):
+        yield range(col_idx, len(grid), grid.width)
+        yield range(len(grid) - grid.width + col_idx, -1, -grid.width)
+
+
+def solution_part_1_grid(grid: Grid) -> int:
+    """Solution to Part 1, run on a compact Grid.
+
+    Walk along each row and column in both directions, marking each tree that is taller than
+    every tree before it. This is the same O(n^2) approach as `calculate_biggest_trees`, without
+    needing to build a Tree object for each tree.
+
+    """
+    cells = grid.cells
+    visible = bytearray(len(grid))
+    for line in _grid_lines(grid):
+        tallest = -1
+        for idx in line:
+            if cells[idx] > tallest:
+                visible[idx] = 1
+                tallest = cells[idx]
+                # Nothing can be seen behind the tallest possible tree
+                if tallest == 9:
+                    break
+    return sum(visible)
+
+
+def solution_part_2_grid(grid: Grid) -> int:
+    """Solution to Part 2, run on a compact Grid.
+
+    Rather than slicing out the trees in each direction from each tree, walk along each row and
+    column in both directions, keeping track of the last position seen of each tree height. The
+    viewing distance back along the line is then the distance to the closest of the trees at least
+    as tall as this tree, making this O(n^2) rather than O(n^3).
+
+    """
+    cells = grid.cells
+    scenic_scores = [1] * len(grid)
+    for line in _grid_lines(grid):
+        last_seen = [0] * 10
+        for position, idx in enumerate(line):
+            height = cells[idx]
+            scenic_scores[idx] *= position - max(last_seen[height:])
+            last_seen[height] = position
+    return max(scenic_scores)
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import os
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 EXAMPLE_INPUT = """
 R 4
@@ -96,6 +96,18 @@ def _parse_input(moves: str) -> List[Tuple[str, int]]:
     at a time. This has time complexity O(n^2) as `extend` has linear complexity.
 
     """
+    return _parse_lines(moves.strip().splitlines())
+
+
+def _parse_input_streaming(path: str) -> List[Tuple[str, int]]:
+    """Parse input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_lines(line for line in iter_lines(path) if line)
+
+
+def _parse_lines(moves: Iterable[str]) -> List[Tuple[str, int]]:
+    """Parse each line of moves into a flattened list of singular moves."""
     cleaned_moves = []
     move_mapping = {
         "R": ("x", 1),
@@ -104,7 +116,7 @@ def _parse_input(moves: str) -> List[Tuple[str, int]]:
         "D": ("y", -1),
     }
     # Split moves by row and create a flattened list of singular moves in either x or y dimension
-    for move in moves.strip().splitlines():
+    for move in moves:
         direction, distance = move.split()
         new_dir, modifier = move_mapping[direction]
         cleaned_moves.extend([(new_dir, modifier)] * int(distance))
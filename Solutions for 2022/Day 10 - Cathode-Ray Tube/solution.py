@@ -1,14 +1,26 @@
 """Solution for day 10 - Cathode-Ray Tube."""
 import os
-from typing import List, Optional, Tuple
+from typing import Iterable, List
 
 
 def _parse_input(program: str) -> List[int]:
     """Parse input data into a more malleable format."""
+    return _parse_lines(program.strip().splitlines())
+
+
+def _parse_input_streaming(path: str) -> List[int]:
+    """Parse input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_lines(line for line in iter_lines(path) if line)
+
+
+def _parse_lines(program: Iterable[str]) -> List[int]:
+    """Walk through each instruction of the program to get the sprite position at each cycle."""
     sprite_positions = [1]
     last_sprite_pos = 1
     # Walk through instructions and add the value for the sprite position at each cycle
-    for instruction in program.strip().splitlines():
+    for instruction in program:
         if instruction == "noop":
             # Simply maintain the sprite position
             sprite_positions.append(last_sprite_pos)
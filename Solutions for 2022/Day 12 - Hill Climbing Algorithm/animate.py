@@ -1,59 +1,87 @@
-"""Create animations to help visualise the solution to the Hill Climbing Alorithm."""
+"""Create animations to help visualise the solution to the Hill Climbing Alorithm.
+
+Plotting libraries are only imported once an animation is requested, and the solution is loaded
+relative to this file, so this can be imported or run from any directory.
+"""
+import importlib.util
 import os
+import sys
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_solution():
+    """Load the solution module alongside this file, regardless of the working directory."""
+    spec = importlib.util.spec_from_file_location("day_12", os.path.join(DIRECTORY, "solution.py"))
+    module = sys.modules.get(spec.name)
+    if module is None:
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def create_animation(data: str, output_path: str, is_example: bool = True) -> None:
+    """Animate the walk from the end down to the start as a heatmap of steps, and save to file."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.animation import FuncAnimation
+
+    Solution = _load_solution().Solution
+    solution = Solution.from_input(data)
+    total_frames = Solution.from_input(data).walk_to_start()
+    fig, ax = plt.subplots(figsize = (12, 8))
+
+    def animate(_, is_example = True):
+        """Animation function to draw heatmap of steps at each iteration of the algorithm."""
+        ax.cla()
+        sns.heatmap(
+            data=solution.visits,
+            ax=ax,
+            cbar=False,
+            vmin=0,
+            vmax=solution.steps,
+            cmap="mako",
+            square=True,
+            linewidth=0.01,
+            xticklabels=False,
+            yticklabels=False,
+        )
+        # Draw crosses on heatmap for start and end locations
+        y_start, x_start = solution.start
+        y_end, x_end = solution.end
+        if is_example:
+            ax.scatter(x_start + 0.5, y_start + 0.5, marker="x", color="r", s=1000, linewidth=7)
+            ax.scatter(x_end + 0.5, y_end + 0.5, marker="x", color="g", s=1000, linewidth=7)
+            ax.text(x_start + 0.2, y_start + 0.9, "START", color="r", size=15, weight="bold")
+            ax.text(x_end + 0.3, y_end + 0.9, "END", color="g", size=15, weight="bold")
+        else:
+            ax.scatter(x_start + 0.5, y_start + 0.5, marker="x", color="r", s=30, linewidth=1)
+            ax.scatter(x_end + 0.5, y_end + 0.5, marker="x", color="g", s=30, linewidth=1)
+
+        # Walk down towards the start one step
+        if not solution._reached_destination(strict_start=True):
+            solution.walk_one_step()
+
+    anim = FuncAnimation(
+        fig=fig, func=animate, frames=total_frames + 10, blit=False, fargs=[is_example]
+    )
+    anim.save(output_path)
+
+
+if __name__ == "__main__":
+    # Create animation for example and save to file
+    create_animation(
+        _load_solution().EXAMPLE_INPUT,
+        os.path.join(DIRECTORY, "example_data_animation.gif"),
+        is_example=True,
+    )
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.animation import FuncAnimation
-
-from solution import EXAMPLE_INPUT, Solution
-
-with open(os.path.join(os.path.dirname(__file__), "data.txt"), "r", encoding="utf-8") as f:
-    FULL_DATA_SET = f.read()
-
-
-def animate(_, is_example = True):
-    """Animation function to draw heatmap of steps at each iteration of the algorithm."""
-    ax.cla()
-    sns.heatmap(
-        data=solution.visits,
-        ax=ax,
-        cbar=False,
-        vmin=0,
-        vmax=solution.steps,
-        cmap="mako",
-        square=True,
-        linewidth=0.01,
-        xticklabels=False,
-        yticklabels=False,
+    # Create animation for full data set and save to file
+    with open(os.path.join(DIRECTORY, "data.txt"), "r", encoding="utf-8") as f:
+        full_data_set = f.read()
+    create_animation(
+        full_data_set,
+        os.path.join(DIRECTORY, "full_dataset_animation.gif"),
+        is_example=False,
     )
-    # Draw crosses on heatmap for start and end locations
-    y_start, x_start = solution.start
-    y_end, x_end = solution.end
-    if is_example:
-        ax.scatter(x_start + 0.5, y_start + 0.5, marker="x", color="r", s=1000, linewidth=7)
-        ax.scatter(x_end + 0.5, y_end + 0.5, marker="x", color="g", s=1000, linewidth=7)
-        ax.text(x_start + 0.2, y_start + 0.9, "START", color="r", size=15, weight="bold")
-        ax.text(x_end + 0.3, y_end + 0.9, "END", color="g", size=15, weight="bold")
-    else:
-        ax.scatter(x_start + 0.5, y_start + 0.5, marker="x", color="r", s=30, linewidth=1)
-        ax.scatter(x_end + 0.5, y_end + 0.5, marker="x", color="g", s=30, linewidth=1)
-
-    # Walk down towards the start one step
-    if not solution._reached_destination(strict_start=True):
-        solution.walk_one_step()
-
-# Create animation for example and save to file
-solution = Solution.from_input(EXAMPLE_INPUT)
-total_frames = Solution.from_input(EXAMPLE_INPUT).walk_to_start()
-
-fig, ax = plt.subplots(figsize = (12, 8))
-anim = FuncAnimation(fig = fig, func=animate, frames=total_frames + 10, blit=False, fargs=[True])
-anim.save(os.path.join(os.path.dirname(__file__), "example_data_animation.gif"))
-
-# Create animation for full data set and save to file
-solution = Solution.from_input(FULL_DATA_SET)
-total_frames = Solution.from_input(FULL_DATA_SET).walk_to_start()
-
-fig, ax = plt.subplots(figsize = (12, 8))
-anim = FuncAnimation(fig = fig, func=animate, frames=total_frames + 10, blit=False, fargs=[False])
-anim.save(os.path.join(os.path.dirname(__file__), "full_dataset_animation.gif"))
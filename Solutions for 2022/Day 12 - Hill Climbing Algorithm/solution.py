@@ -4,8 +4,12 @@ from __future__ import annotations
 import copy
 import math
 import os
+import string
 from dataclasses import dataclass
-from typing import List, NamedTuple, Set, Union
+from typing import TYPE_CHECKING, List, NamedTuple, Set, Tuple
+
+if TYPE_CHECKING:
+    from aoc.grid import Grid
 
 EXAMPLE_INPUT = """
 Sabqponm
@@ -14,6 +18,10 @@ accszExk
 acctuvwj
 abdefghi
 """
+# Translation table converting elevation characters to heights, with start at "a" and end at "z"
+ELEVATIONS = bytes.maketrans(
+    (string.ascii_lowercase + "SE").encode(), bytes(range(26)) + bytes([0, 25])
+)
 
 
 class Position(NamedTuple):
@@ -82,6 +90,21 @@ class Solution:
             active_positions={end},
         )
 
+    def copy(self) -> Solution:
+        """Copy of the solution which can be walked independently.
+
+        The elevations are never modified, so are shared rather than copied.
+
+        """
+        return Solution(
+            elevations=self.elevations,
+            visits=[row[:] for row in self.visits],
+            start=self.start,
+            end=self.end,
+            active_positions=set(self.active_positions),
+            steps=self.steps,
+        )
+
     def walk_to_start(self, strict_start: bool = True) -> int:
         """Wrapper around the walk_one_step method.
 
@@ -95,6 +118,19 @@ class Solution:
             # Walk one step towards the end
             self.walk_one_step()
 
+    def walk_to_start_both_parts(self) -> Tuple[int, int]:
+        """Walk to the start once, answering both parts along the way.
+
+        The start is itself at the lowest elevation, so the walk always reaches the nearest lowest
+        elevation (part 2) no later than it reaches the start (part 1). Rather than walking from
+        the end twice, note the steps taken when first reaching the lowest elevation, then carry on
+        walking until reaching the start.
+
+        """
+        part_2 = self.walk_to_start(strict_start=False)
+        part_1 = self.walk_to_start(strict_start=True)
+        return part_1, part_2
+
     def _reached_destination(self, strict_start: bool) -> bool:
         """Helper method to determine if the end destination has been reached.
 
@@ -167,12 +203,110 @@ class Solution:
         return False
 
 
+@dataclass
+class GridSolution:
+    """Solution for the hill climbing problem, run on compact grids.
+
+    This walks down from the end towards the start in exactly the same way as `Solution`, but
+    stores elevations (0 for "a" to 25 for "z") and visited flags in flat, one byte per position
+    Grids, addressing positions by their flat index. This cuts the memory used per position from
+    hundreds of bytes to two, and makes each neighbour lookup simple arithmetic.
+
+    Rather than recording the number of steps taken to reach each position, only whether each
+    position has been visited is kept, as that is all that is needed to walk to the start.
+
+    """
+
+    elevations: Grid
+    visited: Grid
+    start: int
+    end: int
+    active_positions: List[int]
+    steps: int = 0
+
+    @classmethod
+    def from_input(cls, data: str) -> GridSolution:
+        """Create GridSolution data structure from input."""
+        from aoc.grid import Grid
+
+        raw = data.strip()
+        # Find flat indexes of the start & end, discounting the newlines at the end of each row
+        start = raw.index("S") - raw.count("\n", 0, raw.index("S"))
+        end = raw.index("E") - raw.count("\n", 0, raw.index("E"))
+
+        elevations = Grid.from_lines(raw.splitlines(), table=ELEVATIONS)
+        visited = Grid(elevations.width, elevations.height)
+        visited.cells[end] = 1
+        return GridSolution(
+            elevations=elevations,
+            visited=visited,
+            start=start,
+            end=end,
+            active_positions=[end],
+        )
+
+    def copy(self) -> GridSolution:
+        """Copy of the solution which can be walked independently, sharing the elevations."""
+        return GridSolution(
+            elevations=self.elevations,
+            visited=self.visited.copy(),
+            start=self.start,
+            end=self.end,
+            active_positions=self.active_positions[:],
+            steps=self.steps,
+        )
+
+    def walk_to_start(self, strict_start: bool = True) -> int:
+        """Walk one step at a time continuously until we reach the start location."""
+        while self.active_positions:
+            # Check if we are done
+            if self._reached_destination(strict_start):
+                return self.steps
+            # Walk one step towards the end
+            self.walk_one_step()
+
+    def walk_to_start_both_parts(self) -> Tuple[int, int]:
+        """Walk to the start once, answering both parts along the way, as in `Solution`."""
+        part_2 = self.walk_to_start(strict_start=False)
+        part_1 = self.walk_to_start(strict_start=True)
+        return part_1, part_2
+
+    def _reached_destination(self, strict_start: bool) -> bool:
+        """Helper method to determine if the end destination has been reached."""
+        if self.visited.cells[self.start]:
+            return True
+        elevations = self.elevations.cells
+        return not strict_start and any(elevations[i] == 0 for i in self.active_positions)
+
+    def walk_one_step(self) -> None:
+        """Walk a single step from each active elevation down towards the start.
+
+        A neighbouring position is a valid move if it hasn't already been visited, and the
+        current position is at most 1 unit of elevation higher than it.
+
+        """
+        elevations = self.elevations.cells
+        visited = self.visited.cells
+        neighbours = self.elevations.neighbours
+        new_active_positions = []
+        self.steps += 1
+        for position in self.active_positions:
+            min_elevation = elevations[position] - 1
+            for new_position in neighbours(position):
+                if not visited[new_position] and elevations[new_position] >= min_elevation:
+                    # Mark as visited when first reached, so it's only added to one step
+                    visited[new_position] = 1
+                    new_active_positions.append(new_position)
+        self.active_positions = new_active_positions
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
     print("Results for given example:")
-    print("Part 1:", Solution.from_input(EXAMPLE_INPUT).walk_to_start(strict_start=True))
-    print("Part 2:", Solution.from_input(EXAMPLE_INPUT).walk_to_start(strict_start=False))
+    part_1, part_2 = Solution.from_input(EXAMPLE_INPUT).walk_to_start_both_parts()
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
     # Load local data file
     with open(os.path.join(os.path.dirname(__file__), "data.txt"), "r", encoding="utf-8") as f:
@@ -180,5 +314,6 @@ if __name__ == "__main__":
 
     # Execute solution for solution part 1 & 2
     print("\nResults for full puzzle data:")
-    print("Part 1:", Solution.from_input(data).walk_to_start(strict_start=True))
-    print("Part 2:", Solution.from_input(data).walk_to_start(strict_start=False))
+    part_1, part_2 = Solution.from_input(data).walk_to_start_both_parts()
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Tuple
 
 EXAMPLE_INPUT = """
 [1,1,3,1,1]
@@ -62,6 +62,10 @@ class Packet(list):
         """Wrapper around the list __iter__ to yield Packets in place of lists."""
         return (Packet(i) if isinstance(i, list) else i for i in super().__iter__())
 
+    def __reduce__(self) -> Tuple[type, Tuple[List[Any]]]:
+        """Pickle (and copy) the raw items, rather than the Packets yielded by __iter__."""
+        return Packet, (list(super().__iter__()),)
+
     def __lt__(self, other: Packet) -> bool:
         """Override the list less than dunder method to allow comparing Packets with eachother.
 
@@ -112,8 +116,20 @@ class Packet(list):
 
 def _parse_input(data: str) -> List[Packet]:
     """Walk through input and create list of Packets."""
+    return _parse_lines(data.strip().splitlines())
+
+
+def _parse_input_streaming(path: str) -> List[Packet]:
+    """Walk through input data file one line at a time, without reading it all into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_lines(iter_lines(path))
+
+
+def _parse_lines(lines: Iterable[str]) -> List[Packet]:
+    """Create a Packet from each non-empty line."""
     result = []
-    for packet in data.strip().splitlines():
+    for packet in lines:
         if packet:
             result.append(Packet(json.loads(packet)))
     return result
@@ -1,8 +1,12 @@
 """Solution for day 14 - Regolith Reservoir."""
-import copy
+from __future__ import annotations
+
 import os
 from collections import defaultdict
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from aoc.grid import Grid
 
 EXAMPLE_INPUT = """
 498,4 -> 498,6 -> 496,6
@@ -14,7 +18,18 @@ START_LOC = (500, 0)
 
 def _parse_input(data: str) -> Tuple[Dict[int, Dict[int, str]], int]:
     """Read the cave edge locations from the input and construct dict of all rock locations."""
-    data = data.strip().splitlines()
+    return _parse_lines(data.strip().splitlines())
+
+
+def _parse_input_streaming(path: str) -> Tuple[Dict[int, Dict[int, str]], int]:
+    """Read the cave edge locations one line at a time, without reading it all into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_lines(line for line in iter_lines(path) if line)
+
+
+def _parse_lines(data: Iterable[str]) -> Tuple[Dict[int, Dict[int, str]], int]:
+    """Construct dict of all rock locations from each line of connected walls."""
     cave = defaultdict(dict)
     max_depth = 0
     # Iterate through connected walls in input data
@@ -36,6 +51,11 @@ def _parse_input(data: str) -> Tuple[Dict[int, Dict[int, str]], int]:
     return cave, max_depth
 
 
+def _copy_cave(cave: Dict[int, Dict[int, str]]) -> Dict[int, Dict[int, str]]:
+    """Copy of the cave which sand can be poured into without changing the original."""
+    return defaultdict(dict, {x: dict(column) for x, column in cave.items()})
+
+
 def solution(cave: Dict[int, Dict[int, str]], max_depth: int, part_1: bool) -> int:
     """Solution to both parts of the question.
 
@@ -86,13 +106,108 @@ def solution(cave: Dict[int, Dict[int, str]], max_depth: int, part_1: bool) -> i
     return sand_units
 
 
+def solution_both_parts(cave: Dict[int, Dict[int, str]], max_depth: int) -> Tuple[int, int]:
+    """Solution to both parts of the question, pouring sand into a single cave.
+
+    Until the first unit of sand falls past the lowest rock, sand comes to rest in exactly the same
+    places in both parts. So rather than pouring into a fresh copy of the cave for each part, pour
+    until part 1 is done, then carry on pouring into the same cave until part 2 is done. The unit
+    of sand which fell past the rocks wasn't added to the cave, so is simply poured again.
+
+    The sand is added to the cave it is given.
+
+    """
+    part_1 = solution(cave, max_depth, part_1=True)
+    return part_1, part_1 + solution(cave, max_depth, part_1=False)
+
+
+def _parse_input_grid(data: str) -> Tuple[Grid, int, int]:
+    """Parse input data into a compact Grid of the cave, along with its max depth and x offset.
+
+    Cells hold 0 for air, 1 for rock and 2 for sand. The grid is one row deeper than the floor
+    allows sand to reach, and wide enough that a pile of sand resting on the floor fits within it.
+    The returned x offset is the cave x coordinate of the grid's first column.
+
+    """
+    from aoc.grid import Grid
+
+    rocks, max_depth = _parse_input(data)
+    height = max_depth + 2
+    x_min = min(min(rocks), START_LOC[0] - height)
+    x_max = max(max(rocks), START_LOC[0] + height)
+    cave = Grid(x_max - x_min + 1, height)
+    for rock_x, column in rocks.items():
+        for rock_y in column:
+            cave[rock_y, rock_x - x_min] = 1
+    return cave, max_depth, x_min
+
+
+def solution_grid(cave: Grid, max_depth: int, x_offset: int, part_1: bool) -> int:
+    """Solution to both parts of the question, run on a compact Grid.
+
+    Follows the same rules as `solution`, but the falling sand is tracked by its flat index in the
+    grid, so moving down, down-left and down-right are just `+ width`, `+ width - 1` and
+    `+ width + 1`. The sand is dropped into the cells of the grid it is given, so pass in a copy to
+    keep the original.
+
+    """
+    cells = cave.cells
+    width = cave.width
+    start = START_LOC[0] - x_offset
+    floor = (max_depth + 1) * width
+    sand = start
+    sand_units = 0
+    while True:
+        # Reached the floor
+        if sand >= floor:
+            if part_1:
+                break
+            # For part 2, sand stops here
+            cells[sand] = 2
+            sand = start
+            sand_units += 1
+
+        below = sand + width
+        # Move down
+        if not cells[below]:
+            sand = below
+        # Move down and left
+        elif not cells[below - 1]:
+            sand = below - 1
+        # Move down and right
+        elif not cells[below + 1]:
+            sand = below + 1
+        # Can't move, add sand to this location in cave and start again with next unit
+        else:
+            cells[sand] = 2
+            sand_units += 1
+            # Check if the sand's location is back at the start (part 2 completion)
+            if sand == start:
+                break
+            sand = start
+
+    return sand_units
+
+
+def solution_grid_both_parts(cave: Grid, max_depth: int, x_offset: int) -> Tuple[int, int]:
+    """Solution to both parts of the question, pouring sand into a single compact Grid.
+
+    As in `solution_both_parts`, pour until part 1 is done, then carry on pouring into the same
+    grid until part 2 is done. The sand is dropped into the cells of the grid it is given.
+
+    """
+    part_1 = solution_grid(cave, max_depth, x_offset, part_1=True)
+    return part_1, part_1 + solution_grid(cave, max_depth, x_offset, part_1=False)
+
+
 if __name__ == "__main__":
     """Execute solutions and print results to todays problem."""
     # Print solutions to example in the problem brief
     example_cave, max_depth = _parse_input(EXAMPLE_INPUT)
+    part_1, part_2 = solution_both_parts(example_cave, max_depth)
     print("Results for given example:")
-    print("Part 1:", solution(copy.deepcopy(example_cave), max_depth, part_1=True))
-    print("Part 2:", solution(copy.deepcopy(example_cave), max_depth, part_1=False))
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
 
     # Load local data file
     with open(os.path.join(os.path.dirname(__file__), "data.txt"), "r", encoding="utf-8") as f:
@@ -100,5 +215,6 @@ if __name__ == "__main__":
 
     # Execute solution for solution part 1 & 2
     print("\nResults for full puzzle data:")
-    print("Part 1:", solution(copy.deepcopy(cave), max_depth, part_1=True))
-    print("Part 2:", solution(copy.deepcopy(cave), max_depth, part_1=False))
+    part_1, part_2 = solution_both_parts(cave, max_depth)
+    print("Part 1:", part_1)
+    print("Part 2:", part_2)
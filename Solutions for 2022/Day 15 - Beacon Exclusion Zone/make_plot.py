@@ -1,71 +1,98 @@
-"""Simple script to create visualisations for the distress beacon search."""
+"""Simple script to create visualisations for the distress beacon search.
+
+Plotting libraries are only imported once a plot is requested, and the solution is loaded
+relative to this file, so this can be imported or run from any directory.
+"""
+import importlib.util
 import os
+import sys
 
-from matplotlib.patches import Polygon
-import matplotlib.pyplot as plt
-import seaborn as sns
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
-from solution import EXAMPLE_INPUT, _parse_input, Sensor
 
-# Setup - create sensors, plot and set limits
-sensors = _parse_input(EXAMPLE_INPUT)
-fig, ax = plt.subplots(figsize = (12, 8))
-limit = 20
+def _load_solution():
+    """Load the solution module alongside this file, regardless of the working directory."""
+    spec = importlib.util.spec_from_file_location("day_15", os.path.join(DIRECTORY, "solution.py"))
+    module = sys.modules.get(spec.name)
+    if module is None:
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
 
-pos, neg = [], []
-for sensor in sensors:
-    # Draw sensor range as diamond
-    p = Polygon([
-            (sensor.x - sensor.scan_range, sensor.y),
-            (sensor.x, sensor.y - sensor.scan_range),
-            (sensor.x + sensor.scan_range, sensor.y),
-            (sensor.x, sensor.y + sensor.scan_range),
-        ],
-        alpha=0.2,
-        linewidth=2,
-        edgecolor="k",
-    )
-    ax.add_patch(p)
-    # Annotate with center location and scanning range
-    ax.scatter(sensor.x, sensor.y, color="r", marker="+")
-    ax.annotate(sensor.scan_range, (sensor.x, sensor.y), xytext=(-3, -15), textcoords="offset points", color="r")
 
-    # Calculate y axis intersect as (c = y - mx) then offset by the edge of the scanning range
-    edge_of_scan_range = sensor.scan_range + 1
-    # Positive `y = mx + c` line (`m=1` -> `c = y - x` +/- scan edge)
-    pos.append(sensor.y - sensor.x + edge_of_scan_range)
-    pos.append(sensor.y - sensor.x - edge_of_scan_range)
-    # Negative `y = mx + c` line (`m=-1` -> `c = y + x` +/- scan edge)
-    neg.append(sensor.y + sensor.x + edge_of_scan_range)
-    neg.append(sensor.y + sensor.x - edge_of_scan_range)
+def create_plot(data: str, output_path: str, limit: int = 20) -> None:
+    """Plot each sensor's range with its perimeter lines and their intersects, and save to file."""
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Polygon
+
+    # Setup - create sensors, plot and set limits
+    sensors = _load_solution()._parse_input(data)
+    fig, ax = plt.subplots(figsize = (12, 8))
+
+    pos, neg = [], []
+    for sensor in sensors:
+        # Draw sensor range as diamond
+        p = Polygon([
+                (sensor.x - sensor.scan_range, sensor.y),
+                (sensor.x, sensor.y - sensor.scan_range),
+                (sensor.x + sensor.scan_range, sensor.y),
+                (sensor.x, sensor.y + sensor.scan_range),
+            ],
+            alpha=0.2,
+            linewidth=2,
+            edgecolor="k",
+        )
+        ax.add_patch(p)
+        # Annotate with center location and scanning range
+        ax.scatter(sensor.x, sensor.y, color="r", marker="+")
+        ax.annotate(
+            sensor.scan_range, (sensor.x, sensor.y), xytext=(-3, -15),
+            textcoords="offset points", color="r",
+        )
 
-# Plot lines and intersections
-intersects = set()
-x_coords = range(0, limit + 1)
-for positive_c in pos:
-    for negative_c in neg:
-        # Plot the positive and negative lines
-        ax.plot(x_coords, [i + positive_c for i in x_coords], color="g")
-        ax.plot(x_coords, [-i + negative_c for i in x_coords], color="purple")
+        # Calculate y axis intersect as (c = y - mx) then offset by the edge of the scanning range
+        edge_of_scan_range = sensor.scan_range + 1
+        # Positive `y = mx + c` line (`m=1` -> `c = y - x` +/- scan edge)
+        pos.append(sensor.y - sensor.x + edge_of_scan_range)
+        pos.append(sensor.y - sensor.x - edge_of_scan_range)
+        # Negative `y = mx + c` line (`m=-1` -> `c = y + x` +/- scan edge)
+        neg.append(sensor.y + sensor.x + edge_of_scan_range)
+        neg.append(sensor.y + sensor.x - edge_of_scan_range)
 
-        # Ensure their intersection occurs on whole integer coordinates
-        if (positive_c + negative_c) % 2 != 0:
-            continue
+    # Plot lines and intersections
+    x_coords = range(0, limit + 1)
+    for positive_c in pos:
+        for negative_c in neg:
+            # Plot the positive and negative lines
+            ax.plot(x_coords, [i + positive_c for i in x_coords], color="g")
+            ax.plot(x_coords, [-i + negative_c for i in x_coords], color="purple")
 
-        # Calculate the x and y intersect locations (see README) and ensure it's within bounds
-        x = (negative_c - positive_c) // 2
-        y = (negative_c + positive_c) // 2
-        if 0 <= x <= limit and 0 <= y <= limit:
-            # Plot the intersection location
-            ax.scatter(x, y, marker="o", s=200, edgecolors="r", facecolors="none", linewidths=2)
-            pass
+            # Ensure their intersection occurs on whole integer coordinates
+            if (positive_c + negative_c) % 2 != 0:
+                continue
 
-# Massage the plot
-ax.set_xlim(0, limit)
-ax.set_ylim(0, limit)
-ax.set_xticks(range(limit + 1))
-ax.set_yticks(range(limit + 1))
-ax.set_title("All sensors - Perimeter lines and intersects")
-ax.grid(alpha=0.2)
-# Save
-plt.savefig(os.path.join(os.path.dirname(__file__), "plots", "all_examples_intersects.png"))
+            # Calculate the x and y intersect locations (see README) and ensure it's within bounds
+            x = (negative_c - positive_c) // 2
+            y = (negative_c + positive_c) // 2
+            if 0 <= x <= limit and 0 <= y <= limit:
+                # Plot the intersection location
+                ax.scatter(x, y, marker="o", s=200, edgecolors="r", facecolors="none", linewidths=2)
+
+    # Massage the plot
+    ax.set_xlim(0, limit)
+    ax.set_ylim(0, limit)
+    ax.set_xticks(range(limit + 1))
+    ax.set_yticks(range(limit + 1))
+    ax.set_title("All sensors - Perimeter lines and intersects")
+    ax.grid(alpha=0.2)
+    # Save
+    plt.savefig(output_path)
+
+
+if __name__ == "__main__":
+    create_plot(
+        _load_solution().EXAMPLE_INPUT,
+        os.path.join(DIRECTORY, "plots", "all_examples_intersects.png"),
+        limit=20,
+    )
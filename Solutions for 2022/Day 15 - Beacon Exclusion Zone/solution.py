@@ -3,7 +3,7 @@ import os
 import re
 from dataclasses import dataclass
 from functools import cached_property
-from typing import List
+from typing import Iterable, List
 
 EXAMPLE_INPUT = """
 Sensor at x=8, y=7: closest beacon is at x=2, y=10
@@ -43,7 +43,18 @@ class Sensor:
 
 def _parse_input(data: str) -> List[Sensor]:
     """Parse input data into a more malleable format."""
-    data = data.strip().splitlines()
+    return _parse_lines(data.strip().splitlines())
+
+
+def _parse_input_streaming(path: str) -> List[Sensor]:
+    """Parse input data file one line at a time, without reading the whole file into memory."""
+    from aoc.loader import iter_lines
+
+    return _parse_lines(line for line in iter_lines(path) if line)
+
+
+def _parse_lines(data: Iterable[str]) -> List[Sensor]:
+    """Create a Sensor from each line of input."""
     sensors = []
     for raw_sensor in data:
         sensors.append(Sensor(*map(int, re.findall("-?\d+", raw_sensor))))
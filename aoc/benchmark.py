@@ -0,0 +1,223 @@
+"""Benchmark each day's parse and solve functions against a stored baseline.
+
+Each stage (parse, part 1, part 2 and, where supported, both parts together) of each day is
+executed repeatedly, on both the full puzzle data and the example input from the problem brief,
+and the min, median and 95th percentile timings are reported. Timings can be saved as a baseline
+JSON file, and subsequent runs compare their median timings against it, failing if any stage has
+become slower than its baseline by more than the given tolerance. With `--grid`, the grid-based
+days are additionally benchmarked running their alternative recipes on compact `aoc.grid.Grid`s,
+reported alongside their default recipes under `day_NN/<input>/grid/<stage>`.
+
+Usage (from the repository root):
+
+    python -m aoc.benchmark --save
+    python -m aoc.benchmark --days 12 14 --tolerance 10
+    python -m aoc.benchmark --days 8 12 14 --grid
+
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from aoc.days import (
+    EXAMPLE_PUZZLES, GRID_PUZZLES, REPO_ROOT, Day, discover_days, get_puzzle, load_module, read_data
+)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmark_baseline.json")
+# Ignore regressions smaller than this, as timer noise dominates sub-millisecond stages
+MIN_REGRESSION_SECONDS = 50e-6
+INPUTS = ("data", "example")
+
+
+class Stats(NamedTuple):
+    """Summary statistics of repeated timings, in seconds."""
+
+    min: float
+    median: float
+    p95: float
+    repeats: int
+
+    @classmethod
+    def from_timings(cls, timings: List[float]) -> Stats:
+        """Summarise a list of timings, using the nearest-rank method for the percentile."""
+        ordered = sorted(timings)
+        p95_rank = max(math.ceil(0.95 * len(ordered)), 1)
+        return cls(
+            min=ordered[0],
+            median=statistics.median(ordered),
+            p95=ordered[p95_rank - 1],
+            repeats=len(ordered),
+        )
+
+
+class Regression(NamedTuple):
+    """A benchmark whose median timing exceeds its baseline by more than the tolerance."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        """Percentage slowdown relative to the baseline."""
+        return 100 * (self.current / self.baseline - 1)
+
+
+def time_repeatedly(func: Callable, *args: Any, repeats: int) -> List[float]:
+    """Call a function repeatedly, returning the wall clock time of each call."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def benchmark_day(day: Day, example: bool, repeats: int, grid: bool = False) -> Dict[str, Stats]:
+    """Benchmark each stage of a day's solution, keyed by `day_NN/<input>/<stage>`.
+
+    When `grid`, the day's grid recipe is benchmarked instead, keyed by `day_NN/<input>/grid/...`.
+
+    """
+    puzzle = get_puzzle(day.number, example=example, grid=grid)
+    prefix = f"day_{day.number:02}/{'example' if example else 'data'}{'/grid' if grid else ''}"
+
+    # Silence any output from the solutions themselves
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        module = load_module(day)
+        raw = read_data(day, module, example=example)
+        parsed = puzzle.parse(module, raw)
+        stats = {
+            f"{prefix}/parse": Stats.from_timings(
+                time_repeatedly(puzzle.parse, module, raw, repeats=repeats)
+            ),
+            f"{prefix}/part_1": Stats.from_timings(
+                time_repeatedly(puzzle.part_1, module, parsed, repeats=repeats)
+            ),
+            f"{prefix}/part_2": Stats.from_timings(
+                time_repeatedly(puzzle.part_2, module, parsed, repeats=repeats)
+            ),
+        }
+        if puzzle.both_parts:
+            stats[f"{prefix}/both_parts"] = Stats.from_timings(
+                time_repeatedly(puzzle.both_parts, module, parsed, repeats=repeats)
+            )
+        return stats
+
+
+def run_benchmarks(
+    days: List[Day], inputs: List[str], repeats: int, grid: bool = False
+) -> Dict[str, Stats]:
+    """Benchmark the given days on the given inputs ("data" and/or "example").
+
+    When `grid`, days with a grid recipe are benchmarked with both their default and grid recipes.
+
+    """
+    results = {}
+    for day in days:
+        for input_name in inputs:
+            example = input_name == "example"
+            if example and day.number not in EXAMPLE_PUZZLES:
+                continue
+            results.update(benchmark_day(day, example=example, repeats=repeats))
+            if grid and day.number in GRID_PUZZLES:
+                results.update(benchmark_day(day, example=example, repeats=repeats, grid=True))
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, Stats]:
+    """Load a stored baseline, or an empty baseline if the file doesn't exist yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {name: Stats(**stats) for name, stats in json.load(f).items()}
+
+
+def save_baseline(path: str, results: Dict[str, Stats]) -> None:
+    """Save results as the baseline, updating any existing entries for the same benchmarks."""
+    baseline = {**load_baseline(path), **results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({name: stats._asdict() for name, stats in sorted(baseline.items())}, f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(
+    results: Dict[str, Stats], baseline: Dict[str, Stats], tolerance: float
+) -> List[Regression]:
+    """Compare median timings with the baseline, returning those slower by over `tolerance`%."""
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        baseline_median = baseline[name].median
+        if (
+            stats.median > baseline_median * (1 + tolerance / 100) and
+            stats.median - baseline_median > MIN_REGRESSION_SECONDS
+        ):
+            regressions.append(Regression(name, baseline_median, stats.median))
+    return regressions
+
+
+def format_report(results: Dict[str, Stats], baseline: Dict[str, Stats]) -> str:
+    """Format benchmark results (in milliseconds) alongside any baseline medians."""
+    header = f"{'Benchmark':<32}{'min':>10}{'median':>10}{'p95':>10}{'baseline':>10}{'change':>9}"
+    lines = [header, "-" * len(header)]
+    for name, stats in results.items():
+        line = f"{name:<32}{stats.min * 1000:>10.3f}{stats.median * 1000:>10.3f}"
+        line += f"{stats.p95 * 1000:>10.3f}"
+        if name in baseline:
+            baseline_median = baseline[name].median
+            change = 100 * (stats.median / baseline_median - 1) if baseline_median else 0
+            line += f"{baseline_median * 1000:>10.3f}{change:>+8.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point - exits with a non-zero status if any regressions are found."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", help="Day numbers to run (default: all).")
+    parser.add_argument("--inputs", nargs="+", choices=INPUTS, default=list(INPUTS))
+    parser.add_argument("--repeats", type=int, default=7, help="Timed calls per stage.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file path.")
+    parser.add_argument("--save", action="store_true", help="Save results as the new baseline.")
+    parser.add_argument(
+        "--grid", action="store_true", help="Also benchmark the grid recipes of grid-based days."
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=25.0,
+        help="Permitted slowdown of the median against the baseline, as a percentage.",
+    )
+    args = parser.parse_args(argv)
+
+    days = [day for day in discover_days() if not args.days or day.number in args.days]
+    results = run_benchmarks(days, inputs=args.inputs, repeats=args.repeats, grid=args.grid)
+    baseline = load_baseline(args.baseline)
+    print(format_report(results, baseline))
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+
+    regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by over {args.tolerance}%:")
+        for regression in regressions:
+            print(
+                f"  {regression.name}: {regression.baseline * 1000:.3f}ms -> "
+                f"{regression.current * 1000:.3f}ms ({regression.slowdown:+.1f}%)"
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
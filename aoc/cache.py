@@ -0,0 +1,144 @@
+"""On-disk cache of each day's parsed input, to skip re-parsing unchanged data.
+
+For the heavier days, parsing costs as much as solving, and is repeated on every run. Parsed
+structures are pickled to disk, keyed by a hash of the raw input along with a hash of the
+solution module's source (which holds the parser and the classes it builds), of the recipes in
+`aoc.days` (some of which do part of the parsing themselves) and of the `aoc` modules the parsed
+structures are built with (`aoc.grid` and `aoc.loader`). Editing the data file, the solution or
+any of those modules therefore invalidates the affected cache entries automatically.
+
+The cache is bounded in size, evicting the least recently used entries first. Entries are
+written atomically, so multiple processes can safely share the same cache directory.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from types import ModuleType
+from typing import Any, Callable, List, Tuple
+
+from aoc import days, grid, loader
+from aoc.days import REPO_ROOT
+
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "parsed")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = ".pickle"
+
+
+class ParseCache:
+    """Size-bounded LRU cache of parsed inputs, stored as pickle files in a directory."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialise the cache, creating its directory if needed."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(module: ModuleType, raw: str, recipe: str = "default") -> str:
+        """Cache key for the given raw input parsed by the given solution module.
+
+        Days with alternative recipes (e.g. the grid recipes) parse the same input into different
+        structures, so each recipe is given its own name to keep their entries apart.
+
+        """
+        digest = hashlib.sha256()
+        digest.update(recipe.encode())
+        # Pickles aren't guaranteed to be portable across Python versions
+        digest.update(sys.version.encode())
+        # Some recipes do part of the parsing themselves, and the parsers build on the shared
+        # helpers, so include all of them along with the solution
+        for source_path in (module.__file__, days.__file__, grid.__file__, loader.__file__):
+            with open(source_path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        digest.update(hashlib.sha256(raw.encode("utf-8")).digest())
+        return f"{module.__name__}-{digest.hexdigest()}"
+
+    def _path(self, key: str) -> str:
+        """Path to the file storing the given key."""
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Any:
+        """Load a cached value, raising a KeyError if it isn't in the cache."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (
+            FileNotFoundError,
+            EOFError,
+            pickle.UnpicklingError,
+            # Pickled by an incompatible version of the classes it refers to
+            AttributeError,
+            ModuleNotFoundError,
+            TypeError,
+        ) as e:
+            raise KeyError(key) from e
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process since being loaded, which is harmless
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in the cache, evicting old entries if the cache has grown too large."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+
+    def get_or_parse(
+        self, module: ModuleType, raw: str, parse: Callable[[str], Any], recipe: str = "default"
+    ) -> Any:
+        """Load the parsed input from the cache, or parse it and store the result in the cache."""
+        key = self.key(module, raw, recipe)
+        try:
+            return self.get(key)
+        except KeyError:
+            pass
+        parsed = parse(raw)
+        self.put(key, parsed)
+        return parsed
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """List `(last used, size, path)` for each entry, least recently used first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits within its size limit."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for _, _, path in self.entries():
+            os.unlink(path)
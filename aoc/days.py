@@ -0,0 +1,256 @@
+"""Discover and load the daily solutions without executing their `__main__` blocks.
+
+The day folders contain spaces in their names (e.g. "Day 01 - Calorie Counting"), so they cannot
+be imported as regular packages. Instead each `solution.py` is loaded directly from its file path,
+and a small recipe per day describes how to call its parse and solve functions, mirroring what the
+`__main__` block of that day would otherwise do.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from aoc.instrument import instrument_module
+from aoc.loader import iter_lines
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+SOLUTIONS_DIR = os.path.join(REPO_ROOT, "Solutions for 2022")
+DAY_DIR_PATTERN = re.compile(r"^Day (\d+) - (.+)$")
+
+
+class Day(NamedTuple):
+    """A single day's solution folder."""
+
+    number: int
+    title: str
+    directory: str
+
+    @property
+    def solution_path(self) -> str:
+        """Absolute path to this day's solution module."""
+        return os.path.join(self.directory, "solution.py")
+
+    @property
+    def data_path(self) -> str:
+        """Absolute path to this day's puzzle data file."""
+        return os.path.join(self.directory, "data.txt")
+
+
+def _read_file(day: Day, file_name: str) -> str:
+    """Read a file from a day's folder."""
+    with open(os.path.join(day.directory, file_name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _example_input(module: ModuleType, day: Day) -> str:
+    """Load the example input given in the problem brief."""
+    return module.EXAMPLE_INPUT
+
+
+def _data_input(module: ModuleType, day: Day) -> str:
+    """Load the full puzzle data file."""
+    return _read_file(day, os.path.basename(day.data_path))
+
+
+class Puzzle(NamedTuple):
+    """Recipe describing how to load, parse and solve a day's puzzle from its loaded module.
+
+    Each callable receives the loaded solution module. `load` additionally receives the day, and
+    returns the raw puzzle input. `parse` receives that raw input, while the parts receive the
+    parsed result. Parts must not mutate the parsed input, so that both parts can be run from a
+    single parse.
+
+    Where given, `parse_streaming` receives the path to the data file rather than its contents,
+    and streams it from disk to produce the same result as `parse`. Likewise `both_parts` receives
+    the parsed result, and returns the answers to both parts together, sharing the work between
+    them rather than repeating it for each part.
+
+    """
+
+    parse: Callable[[ModuleType, str], Any]
+    part_1: Callable[[ModuleType, Any], Any]
+    part_2: Callable[[ModuleType, Any], Any]
+    load: Callable[[ModuleType, Day], str] = _data_input
+    parse_streaming: Optional[Callable[[ModuleType, str], Any]] = None
+    both_parts: Optional[Callable[[ModuleType, Any], Tuple[Any, Any]]] = None
+
+
+def _parse(module: ModuleType, raw: str) -> Any:
+    """Default parse step - the day's own `_parse_input`."""
+    return module._parse_input(raw)
+
+
+def _parse_streaming(module: ModuleType, path: str) -> Any:
+    """Default streaming parse step - the day's own `_parse_input_streaming`."""
+    return module._parse_input_streaming(path)
+
+
+def _part_1(module: ModuleType, parsed: Any) -> Any:
+    """Default part 1 step - the day's own `solution_part_1`."""
+    return module.solution_part_1(parsed)
+
+
+def _part_2(module: ModuleType, parsed: Any) -> Any:
+    """Default part 2 step - the day's own `solution_part_2`."""
+    return module.solution_part_2(parsed)
+
+
+PUZZLES: Dict[int, Puzzle] = {
+    1: Puzzle(_parse, _part_1, _part_2, parse_streaming=_parse_streaming),
+    2: Puzzle(
+        parse=lambda m, raw: m.count_lines(raw.encode("ascii")),
+        part_1=lambda m, data: m.score_counts(data, m.PART_1_RESPONSE_MAPPING),
+        part_2=lambda m, data: m.score_counts(data, m.PART_2_RESPONSE_MAPPING),
+        parse_streaming=lambda m, path: m.count_file(path),
+    ),
+    3: Puzzle(
+        parse=lambda m, raw: raw.strip().splitlines(),
+        part_1=_part_1,
+        part_2=_part_2,
+        parse_streaming=lambda m, path: [line for line in iter_lines(path) if line],
+    ),
+    4: Puzzle(
+        parse=lambda m, raw: m._parse_input(raw.strip().splitlines()),
+        part_1=_part_1,
+        part_2=_part_2,
+        parse_streaming=_parse_streaming,
+    ),
+    5: Puzzle(
+        parse=_parse,
+        part_1=lambda m, data: m.solution_part_1(data[0].snapshot(), data[1]),
+        part_2=lambda m, data: m.solution_part_2(data[0].snapshot(), data[1]),
+        parse_streaming=_parse_streaming,
+        both_parts=lambda m, data: m.solution_both_parts(*data),
+    ),
+    6: Puzzle(
+        parse=_parse,
+        part_1=lambda m, data: m.solution_scan(data, buffer_size=4),
+        part_2=lambda m, data: m.solution_scan(data, buffer_size=14),
+        parse_streaming=_parse_streaming,
+    ),
+    7: Puzzle(_parse, _part_1, _part_2, parse_streaming=_parse_streaming),
+    8: Puzzle(_parse, _part_1, _part_2, parse_streaming=_parse_streaming),
+    9: Puzzle(
+        parse=_parse,
+        part_1=lambda m, data: m.solution(data),
+        part_2=lambda m, data: m.solution(data, total_knots=10),
+        parse_streaming=_parse_streaming,
+    ),
+    10: Puzzle(_parse, _part_1, _part_2, parse_streaming=_parse_streaming),
+    11: Puzzle(
+        parse=lambda m, raw: m.TEST_INPUT,
+        part_1=lambda m, data: m.solution(data, rounds=20, divisor=3),
+        part_2=lambda m, data: m.solution(data, rounds=10_000, divisor=1),
+        load=lambda m, day: "",
+    ),
+    12: Puzzle(
+        parse=lambda m, raw: m.Solution.from_input(raw),
+        part_1=lambda m, data: data.copy().walk_to_start(strict_start=True),
+        part_2=lambda m, data: data.copy().walk_to_start(strict_start=False),
+        both_parts=lambda m, data: data.copy().walk_to_start_both_parts(),
+    ),
+    13: Puzzle(_parse, _part_1, _part_2, parse_streaming=_parse_streaming),
+    14: Puzzle(
+        parse=_parse,
+        part_1=lambda m, data: m.solution(m._copy_cave(data[0]), data[1], part_1=True),
+        part_2=lambda m, data: m.solution(m._copy_cave(data[0]), data[1], part_1=False),
+        parse_streaming=_parse_streaming,
+        both_parts=lambda m, data: m.solution_both_parts(m._copy_cave(data[0]), data[1]),
+    ),
+    15: Puzzle(
+        parse=_parse,
+        part_1=lambda m, data: m.solution_part_1(data, target_row=2_000_000),
+        part_2=lambda m, data: m.solution_part_2(data, limit=4_000_000),
+        parse_streaming=_parse_streaming,
+    ),
+}
+
+
+# Recipes for the examples given in each problem brief. Day 11 has no parsed example input.
+EXAMPLE_PUZZLES: Dict[int, Puzzle] = {
+    number: puzzle._replace(load=_example_input)
+    for number, puzzle in PUZZLES.items()
+    if number != 11
+}
+EXAMPLE_PUZZLES[10] = PUZZLES[10]._replace(load=lambda m, day: _read_file(day, "example.txt"))
+EXAMPLE_PUZZLES[15] = PUZZLES[15]._replace(
+    part_1=lambda m, data: m.solution_part_1(data, target_row=10),
+    part_2=lambda m, data: m.solution_part_2(data, limit=20),
+    load=_example_input,
+)
+
+
+# Alternative recipes for the grid-based days, storing their grids as compact `aoc.grid.Grid`s
+GRID_PUZZLES: Dict[int, Puzzle] = {
+    8: Puzzle(
+        parse=lambda m, raw: m._parse_input_grid(raw),
+        part_1=lambda m, data: m.solution_part_1_grid(data),
+        part_2=lambda m, data: m.solution_part_2_grid(data),
+    ),
+    12: Puzzle(
+        parse=lambda m, raw: m.GridSolution.from_input(raw),
+        part_1=lambda m, data: data.copy().walk_to_start(strict_start=True),
+        part_2=lambda m, data: data.copy().walk_to_start(strict_start=False),
+        both_parts=lambda m, data: data.copy().walk_to_start_both_parts(),
+    ),
+    14: Puzzle(
+        parse=lambda m, raw: m._parse_input_grid(raw),
+        part_1=lambda m, data: m.solution_grid(data[0].copy(), *data[1:], part_1=True),
+        part_2=lambda m, data: m.solution_grid(data[0].copy(), *data[1:], part_1=False),
+        both_parts=lambda m, data: m.solution_grid_both_parts(data[0].copy(), *data[1:]),
+    ),
+}
+EXAMPLE_GRID_PUZZLES: Dict[int, Puzzle] = {
+    number: puzzle._replace(load=_example_input) for number, puzzle in GRID_PUZZLES.items()
+}
+
+
+def get_puzzle(number: int, example: bool = False, grid: bool = False) -> Puzzle:
+    """Get a day's recipe, for its example input if `example`, using its grid recipe if `grid`."""
+    grid_puzzles = EXAMPLE_GRID_PUZZLES if example else GRID_PUZZLES
+    if grid and number in grid_puzzles:
+        return grid_puzzles[number]
+    return EXAMPLE_PUZZLES[number] if example else PUZZLES[number]
+
+
+def discover_days(solutions_dir: str = SOLUTIONS_DIR) -> List[Day]:
+    """Find every day folder containing a `solution.py`, ordered by day number."""
+    days = []
+    for name in os.listdir(solutions_dir):
+        match = DAY_DIR_PATTERN.match(name)
+        directory = os.path.join(solutions_dir, name)
+        if match and os.path.isfile(os.path.join(directory, "solution.py")):
+            days.append(Day(int(match.group(1)), match.group(2), directory))
+    return sorted(days)
+
+
+def get_day(number: int, solutions_dir: str = SOLUTIONS_DIR) -> Day:
+    """Get a single day folder by its day number."""
+    for day in discover_days(solutions_dir):
+        if day.number == number:
+            return day
+    raise KeyError(f"No solution found for day {number}.")
+
+
+def load_module(day: Day) -> ModuleType:
+    """Load a day's solution module from its file path, without running its `__main__` block.
+
+    If instrumentation is switched on (see `aoc.instrument`), its hot-path functions are wrapped.
+
+    """
+    spec = importlib.util.spec_from_file_location(f"day_{day.number:02}", day.solution_path)
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing, as dataclasses look their module up in sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    instrument_module(module, day.number)
+    return module
+
+
+def read_data(day: Day, module: ModuleType, example: bool = False) -> str:
+    """Read the raw puzzle input for a day, or the example input from its problem brief."""
+    return get_puzzle(day.number, example=example).load(module, day)
@@ -0,0 +1,343 @@
+"""Seeded generators of synthetic puzzle inputs, of any chosen size, for each day.
+
+The puzzle data files are only a few KB each, which hides how the solutions scale. Each generator
+here produces a valid input in the same format as that day's `data.txt`, where `size` controls the
+scale of the input (the meaning of `size` for each day is given in the generator's docstring).
+
+Generators yield the input one line at a time, so that very large inputs can be written straight
+to disk without being held in memory. The same day, size and seed always produce the same file.
+
+Day 11 is not included, as its input is hardcoded into the solution rather than parsed.
+
+Usage (from the repository root):
+
+    python -m aoc.generators 8 10000
+    python -m aoc.generators 1 1000000 --seed 7 --output elves.txt
+
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import string
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from aoc.days import REPO_ROOT
+
+GENERATED_DIR = os.path.join(REPO_ROOT, "generated")
+# Day 15 searches for the distress beacon between 0 and this limit in both dimensions
+DAY_15_LIMIT = 4_000_000
+
+
+def generate_day_01(rng: random.Random, size: int) -> Iterator[str]:
+    """Calorie lists for `size` elves, separated by blank lines."""
+    for elf in range(size):
+        if elf:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
+
+
+def generate_day_02(rng: random.Random, size: int) -> Iterator[str]:
+    """Strategy guide of `size` rounds."""
+    rounds = [f"{opponent} {response}" for opponent in "ABC" for response in "XYZ"]
+    for _ in range(size):
+        yield rng.choice(rounds)
+
+
+def generate_day_03(rng: random.Random, size: int) -> Iterator[str]:
+    """Contents of `size` rucksacks (rounded up to a whole group of three).
+
+    Each group of three shares exactly one badge item type, and the two compartments of each
+    rucksack share exactly one item type. This is guaranteed by giving each rucksack in a group its
+    own disjoint pool of item types, alongside the group's badge.
+
+    """
+    item_types = string.ascii_letters
+    for _ in range(0, size, 3):
+        badge = rng.choice(item_types)
+        others = [i for i in item_types if i != badge]
+        rng.shuffle(others)
+        for pool_no in range(3):
+            pool = others[pool_no * 17:(pool_no + 1) * 17]
+            # Pick the item shared by both compartments, and split the rest of the pool between them
+            shared = rng.choice(pool + [badge])
+            pool = [i for i in pool if i != shared]
+            left_pool, right_pool = pool[:len(pool) // 2], pool[len(pool) // 2:]
+            compartment_size = rng.randint(4, 16)
+            left = [shared] + rng.choices(left_pool, k=compartment_size - 1)
+            right = [shared] + rng.choices(right_pool, k=compartment_size - 1)
+            # Ensure the badge is present when it isn't already the shared item
+            if badge != shared:
+                left[-1] = badge
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield "".join(left + right)
+
+
+def generate_day_04(rng: random.Random, size: int) -> Iterator[str]:
+    """Section assignments for `size` pairs of elves."""
+    for _ in range(size):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            ranges.append(f"{start}-{rng.randint(start, 99)}")
+        yield ",".join(ranges)
+
+
+def generate_day_05(rng: random.Random, size: int) -> Iterator[str]:
+    """Nine stacks holding roughly `size` crates in total, followed by `size` valid moves."""
+    n_stacks = 9
+    heights = [rng.randint(1, max(1, 2 * size // n_stacks)) for _ in range(n_stacks)]
+
+    # Draw the stacks from the top row down, followed by the stack numbers
+    for row in range(max(heights), 0, -1):
+        crates = [
+            f"[{rng.choice(string.ascii_uppercase)}]" if height >= row else "   "
+            for height in heights
+        ]
+        yield " ".join(crates).rstrip()
+    yield " " + "   ".join(str(i) for i in range(1, n_stacks + 1))
+    yield ""
+
+    # Only ever move crates from a stack that has enough of them
+    for _ in range(size):
+        start = rng.choice([i for i, height in enumerate(heights) if height])
+        stop = rng.choice([i for i in range(n_stacks) if i != start])
+        count = rng.randint(1, max(1, heights[start] // 2))
+        heights[start] -= count
+        heights[stop] += count
+        yield f"move {count} from {start + 1} to {stop + 1}"
+
+
+def generate_day_06(rng: random.Random, size: int) -> Iterator[str]:
+    """A datastream of `size` characters, with its first markers only found at the very end.
+
+    The body only uses three distinct characters, so no window of four or more unique characters
+    can be found until the final fourteen characters.
+
+    """
+    body_size = max(size - 14, 0)
+    chunk_size = 1 << 16
+    chunks = []
+    for start in range(0, body_size, chunk_size):
+        chunks.append("".join(rng.choices("abc", k=min(chunk_size, body_size - start))))
+    markers = list(string.ascii_lowercase[3:])
+    rng.shuffle(markers)
+    yield "".join(chunks) + "".join(markers[:14])
+
+
+def generate_day_07(rng: random.Random, size: int) -> Iterator[str]:
+    """Terminal transcript exploring a file system of `size` directories.
+
+    Every directory holds at least one file, as the solution expects `ls` to always return output.
+    The transcript ends after the final `ls`, without climbing back out to the root.
+
+    """
+    # Build a random tree, where each directory's parent was created before it
+    children: List[List[int]] = [[] for _ in range(max(size, 1))]
+    for directory in range(1, size):
+        children[rng.randrange(directory)].append(directory)
+    names = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))) + str(directory)
+        for directory in range(max(size, 1))
+    ]
+
+    def listing(directory: int) -> Iterator[str]:
+        """Output of running ls in the given directory."""
+        yield "$ ls"
+        for child in children[directory]:
+            yield f"dir {names[child]}"
+        for file_no in range(rng.randint(1, 5)):
+            extension = rng.choice(["", ".txt", ".dat", ".log", ".lst"])
+            yield f"{rng.randint(1, 300_000)} {names[directory]}_{file_no}{extension}"
+
+    yield "$ cd /"
+    yield from listing(0)
+    # Walk the tree depth first, deferring `cd ..` until we know another directory follows
+    pending_cd_up = 0
+    stack = [iter(children[0])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            pending_cd_up += 1
+            continue
+        for _ in range(pending_cd_up):
+            yield "$ cd .."
+        pending_cd_up = 0
+        yield f"$ cd {names[child]}"
+        yield from listing(child)
+        stack.append(iter(children[child]))
+
+
+def generate_day_08(rng: random.Random, size: int) -> Iterator[str]:
+    """A `size` x `size` grid of tree heights."""
+    for _ in range(size):
+        yield "".join(rng.choices(string.digits, k=size))
+
+
+def generate_day_09(rng: random.Random, size: int) -> Iterator[str]:
+    """`size` rope head motions."""
+    for _ in range(size):
+        yield f"{rng.choice('RLUD')} {rng.randint(1, 20)}"
+
+
+def generate_day_10(rng: random.Random, size: int) -> Iterator[str]:
+    """A program of `size` instructions, at least enough to draw all 240 pixels of the CRT."""
+    for _ in range(max(size, 240)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            yield f"addx {rng.randint(-20, 20)}"
+
+
+def generate_day_12(rng: random.Random, size: int) -> Iterator[str]:
+    """A `size` x `size` height map (minimum 14 x 14), with a guaranteed route from S to E.
+
+    The start is placed in the top left and the end in the bottom right. A random staircase path
+    between the two climbs steadily from "a" to "z", while the rest of the map is random. The path
+    only moves right or down, so it can be generated row by row without holding the whole map.
+
+    """
+    size = max(size, 14)
+    path_length = 2 * (size - 1)
+    step = 0
+    col = 0
+    for row in range(size):
+        line = rng.choices(string.ascii_lowercase, k=size)
+        # Walk the path right along this row, until it turns down (or reaches the end)
+        end_col = size - 1 if row == size - 1 else rng.randint(col, size - 1)
+        for path_col in range(col, end_col + 1):
+            line[path_col] = string.ascii_lowercase[25 * step // path_length]
+            step += 1
+        col = end_col
+        if row == 0:
+            line[0] = "S"
+        if row == size - 1:
+            line[-1] = "E"
+        yield "".join(line)
+
+
+def _random_packet(rng: random.Random, depth: int) -> List[Any]:
+    """Create a random packet, nested at most `depth` lists deep."""
+    packet = []
+    for _ in range(rng.randint(0, 5)):
+        if depth > 1 and rng.random() < 0.4:
+            packet.append(_random_packet(rng, depth - 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def generate_day_13(rng: random.Random, size: int) -> Iterator[str]:
+    """`size` pairs of packets, nested up to ten lists deep."""
+    for pair in range(size):
+        if pair:
+            yield ""
+        for _ in range(2):
+            yield json.dumps(_random_packet(rng, depth=10), separators=(",", ":"))
+
+
+def generate_day_14(rng: random.Random, size: int) -> Iterator[str]:
+    """`size` paths of rock, in a cave whose depth grows with the square root of `size`."""
+    max_depth = max(10, int(10 * size ** 0.5))
+    for _ in range(size):
+        x = rng.randint(500 - max_depth, 500 + max_depth)
+        y = rng.randint(1, max_depth)
+        points = [f"{x},{y}"]
+        for segment in range(rng.randint(1, 5)):
+            # Alternate between horizontal and vertical segments, staying below the sand source
+            if segment % 2:
+                y = min(max(y + rng.randint(-10, 10), 1), max_depth)
+            else:
+                x += rng.randint(-10, 10)
+            points.append(f"{x},{y}")
+        yield " -> ".join(points)
+
+
+def generate_day_15(rng: random.Random, size: int) -> Iterator[str]:
+    """`size` sensors (minimum 4), leaving exactly one hidden distress beacon location.
+
+    The beacon is placed randomly within the search area. Four sensors placed diagonally around it,
+    with ranges reaching just short of it, cover every other location in the search area. The
+    remaining sensors are scattered randomly, with ranges that never reach the distress beacon.
+
+    """
+    beacon_x = rng.randint(0, DAY_15_LIMIT)
+    beacon_y = rng.randint(0, DAY_15_LIMIT)
+    offset = max(beacon_x, beacon_y, DAY_15_LIMIT - beacon_x, DAY_15_LIMIT - beacon_y) + 1
+    template = "Sensor at x={}, y={}: closest beacon is at x={}, y={}"
+
+    sensors = []
+    for x_sign, y_sign in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        x = beacon_x + x_sign * offset
+        y = beacon_y + y_sign * offset
+        # Closest beacon lies at distance (2 * offset - 1), one step short of the distress beacon
+        sensors.append(template.format(x, y, x - x_sign * (2 * offset - 1), y))
+    for _ in range(max(size, 4) - 4):
+        x, y = beacon_x, beacon_y
+        while (x, y) == (beacon_x, beacon_y):
+            x = rng.randint(0, DAY_15_LIMIT)
+            y = rng.randint(0, DAY_15_LIMIT)
+        distance = abs(x - beacon_x) + abs(y - beacon_y)
+        scan_range = rng.randint(0, min(distance - 1, DAY_15_LIMIT // 4))
+        dx = rng.randint(-scan_range, scan_range)
+        dy = (scan_range - abs(dx)) * rng.choice((1, -1))
+        sensors.append(template.format(x, y, x + dx, y + dy))
+    rng.shuffle(sensors)
+    yield from sensors
+
+
+GENERATORS: Dict[int, Callable[[random.Random, int], Iterator[str]]] = {
+    1: generate_day_01,
+    2: generate_day_02,
+    3: generate_day_03,
+    4: generate_day_04,
+    5: generate_day_05,
+    6: generate_day_06,
+    7: generate_day_07,
+    8: generate_day_08,
+    9: generate_day_09,
+    10: generate_day_10,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+}
+
+
+def generate_lines(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    """Generate the lines of a synthetic input for the given day."""
+    if day not in GENERATORS:
+        raise KeyError(f"No input generator exists for day {day}.")
+    return GENERATORS[day](random.Random(seed), size)
+
+
+def write_input(day: int, size: int, seed: int = 0, path: Optional[str] = None) -> str:
+    """Write a synthetic input for the given day to file, returning the path written to."""
+    if path is None:
+        path = os.path.join(GENERATED_DIR, f"day_{day:02}_size_{size}_seed_{seed}.txt")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for line in generate_lines(day, size, seed):
+            f.write(line)
+            f.write("\n")
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS), help="Day to generate for.")
+    parser.add_argument("size", type=int, help="Scale of the input (meaning differs per day).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--output", help="File to write to (default: generated/ folder).")
+    args = parser.parse_args(argv)
+    print(write_input(args.day, args.size, seed=args.seed, path=args.output))
+
+
+if __name__ == "__main__":
+    main()
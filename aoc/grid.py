@@ -0,0 +1,107 @@
+"""Compact two-dimensional grid shared by the grid-based days.
+
+Nested lists of Python objects cost tens to hundreds of bytes per cell, and every neighbour lookup
+goes through two levels of list indexing. `Grid` instead stores small integer cells row by row in a
+single flat `array` (one byte per cell by default), with cells addressed by a flat index so that
+moving between neighbours is simple arithmetic: up is `index - width`, right is `index + 1` etc.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class Grid:
+    """Grid of small integers, stored as a flat array in row-major order."""
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(
+        self, width: int, height: int, cells: Optional[array] = None, typecode: str = "B"
+    ):
+        """Create a grid of the given size, wrapping existing cells or filling it with zeros."""
+        if cells is None:
+            cells = array(typecode, bytes(width * height * array(typecode).itemsize))
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}.")
+        self.width = width
+        self.height = height
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], table: Optional[bytes] = None) -> Grid:
+        """Create a one byte per cell grid from lines of text, one character per cell.
+
+        Characters are converted to cell values with the given `bytes.maketrans` table, if any.
+
+        """
+        cells = array("B")
+        width = height = 0
+        for line in lines:
+            row = line.encode("ascii")
+            if table is not None:
+                row = row.translate(table)
+            if height and len(row) != width:
+                raise ValueError(f"Row {height} has {len(row)} cells, expected {width}.")
+            width = len(row)
+            cells.frombytes(row)
+            height += 1
+        return cls(width, height, cells)
+
+    def __len__(self) -> int:
+        """Total number of cells in the grid."""
+        return len(self.cells)
+
+    def index(self, row: int, col: int) -> int:
+        """Flat index of the cell at the given row and column."""
+        return row * self.width + col
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Row and column of the cell at the given flat index."""
+        return divmod(index, self.width)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """Whether the given row and column lie within the grid."""
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position: Tuple[int, int]) -> int:
+        """Value of the cell at the given (row, col)."""
+        row, col = position
+        return self.cells[row * self.width + col]
+
+    def __setitem__(self, position: Tuple[int, int], value: int) -> None:
+        """Set the value of the cell at the given (row, col)."""
+        row, col = position
+        self.cells[row * self.width + col] = value
+
+    def row(self, row: int) -> memoryview:
+        """Zero-copy view of a single row of cells."""
+        start = row * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, col: int) -> memoryview:
+        """Zero-copy (strided) view of a single column of cells."""
+        return memoryview(self.cells)[col::self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        """Zero-copy views of each row of cells, from top to bottom."""
+        return (self.row(row) for row in range(self.height))
+
+    def neighbours(self, index: int) -> List[int]:
+        """Flat indexes of the cells up, down, left and right of the given cell, within bounds."""
+        width = self.width
+        col = index % width
+        neighbours = []
+        if index >= width:
+            neighbours.append(index - width)
+        if index + width < len(self.cells):
+            neighbours.append(index + width)
+        if col:
+            neighbours.append(index - 1)
+        if col + 1 < width:
+            neighbours.append(index + 1)
+        return neighbours
+
+    def copy(self) -> Grid:
+        """Independent copy of the grid, duplicating its cells with a single memory copy."""
+        return Grid(self.width, self.height, self.cells[:])
@@ -0,0 +1,108 @@
+"""Report the import cost of each day's solution module, akin to `python -X importtime`.
+
+Each day's solution is loaded in a fresh interpreter running with `-X importtime`, so that no
+import is hidden by having already been cached by an earlier day. Only the imports triggered by
+loading the solution itself are counted, not those made while the interpreter starts up.
+
+Usage (from the repository root):
+
+    python -m aoc.importtime
+    python -m aoc.importtime --days 12 15 --top 5
+
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional, Tuple
+
+from aoc.days import Day, discover_days
+
+MARKER = "-- loading solution --"
+# Loads the solution from its path, timing the load and marking where its imports begin. Only
+# modules already imported during interpreter start up are used, so no solution imports are hidden
+LOADER = f"""
+import importlib.util, sys, time
+sys.stderr.write({MARKER!r} + "\\n")
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("solution", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+class ImportReport(NamedTuple):
+    """Time taken to load a day's solution, and the cumulative time of each top-level import."""
+
+    day: Day
+    load_time: float
+    imports: List[Tuple[str, float]]
+
+    @property
+    def import_time(self) -> float:
+        """Total time spent importing other modules while loading the solution."""
+        return sum(duration for _, duration in self.imports)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, float]]:
+    """Get the cumulative time of each top-level import following the marker, slowest first.
+
+    Lines are of the form `import time: <self us> | <cumulative us> | <indented module name>`,
+    where the indentation of the name gives the nesting level of the import.
+
+    """
+    imports = []
+    lines = stderr.splitlines()
+    for line in lines[lines.index(MARKER) + 1:]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level imports are preceded by a single space, nested imports by more
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports.append((name.strip(), int(cumulative) / 1_000_000))
+    return sorted(imports, key=lambda item: item[1], reverse=True)
+
+
+def measure_day(day: Day) -> ImportReport:
+    """Load a day's solution in a fresh interpreter and measure its import cost."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOADER, day.solution_path],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return ImportReport(day, float(result.stdout), parse_importtime(result.stderr))
+
+
+def format_report(reports: List[ImportReport], top: int) -> str:
+    """Format the import reports as a table (in milliseconds) with the slowest imports per day."""
+    header = f"{'Day':<4}{'load':>9}{'imports':>9}  Slowest imports"
+    lines = [header, "-" * 80]
+    for report in reports:
+        line = f"{report.day.number:<4}{report.load_time * 1000:>9.1f}"
+        line += f"{report.import_time * 1000:>9.1f}  "
+        slowest = ", ".join(
+            f"{name} {duration * 1000:.1f}" for name, duration in report.imports[:top]
+        )
+        lines.append(line + slowest)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", help="Day numbers to run (default: all).")
+    parser.add_argument("--top", type=int, default=3, help="Slowest imports to list per day.")
+    args = parser.parse_args(argv)
+
+    days = [day for day in discover_days() if not args.days or day.number in args.days]
+    # Measure one day at a time, so that the interpreters don't compete for CPU
+    reports = [measure_day(day) for day in days]
+    print(format_report(reports, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Lightweight timing instrumentation of each day's hot-path functions.
+
+When switched on, each day's parse and solve functions (and the methods of day 12's solvers)
+are wrapped as the solution module is loaded, emitting one JSON-lines event per call with the day,
+the function, the size of the input in bytes and lines, the duration of the call and the peak RSS
+of the process so far. For example:
+
+    {"day": 14, "function": "solution", "input_bytes": 22228, "input_lines": 145, ...}
+
+Instrumentation is switched on by setting the `AOC_INSTRUMENT` environment variable to the path of
+a file to append events to (or "-" for stderr), so no solution needs editing:
+
+    AOC_INSTRUMENT=events.jsonl python -m aoc.runner
+
+When switched off nothing is wrapped at all, so the solutions run with no added cost.
+
+Functions that aren't given the raw input directly (e.g. `solution_part_1(parsed)`) report the
+size of the last raw input seen by that day's functions. As some recipes transform the raw input
+(e.g. splitting it into lines) before any instrumented function sees it, the runner also records
+the size of each day's raw input, or data file, with `record_input` before parsing it.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Optional, TextIO, Tuple
+
+from aoc.loader import mapped_file
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+ENV_VAR = "AOC_INSTRUMENT"
+# Attribute of an instrumented module holding its Instrumenter
+INSTRUMENTER_ATTR = "__instrumenter__"
+FUNCTIONS = (
+    "_parse_input",
+    "solution_part_1",
+    "solution_part_2",
+    "solution",
+    "solution_both_parts",
+    "solution_scan",
+    "count_lines",
+    "count_file",
+    "score_counts",
+)
+METHODS = {
+    "Solution": ("from_input", "walk_one_step", "walk_to_start", "walk_to_start_both_parts"),
+    "GridSolution": ("from_input", "walk_one_step", "walk_to_start", "walk_to_start_both_parts"),
+}
+
+_sink: Optional[TextIO] = None
+
+
+def get_sink() -> Optional[TextIO]:
+    """Get the stream events are written to, or None if instrumentation is switched off."""
+    global _sink
+    target = os.environ.get(ENV_VAR)
+    if not target:
+        return None
+    if _sink is None:
+        # Line buffered, so each event reaches the file in a single write, even across processes
+        _sink = sys.stderr if target == "-" else open(target, "a", buffering=1, encoding="utf-8")
+    return _sink
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KB, where supported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports in bytes rather than KB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure_input(data: Any) -> Optional[Tuple[int, int]]:
+    """Size of a raw input in bytes and lines, or None if it isn't a raw str/bytes input."""
+    if isinstance(data, str):
+        n_bytes = len(data) if data.isascii() else len(data.encode("utf-8"))
+        newline = "\n"
+    elif isinstance(data, (bytes, bytearray)):
+        n_bytes = len(data)
+        newline = b"\n"
+    else:
+        return None
+    n_lines = data.count(newline) + (1 if data and not data.endswith(newline) else 0)
+    return n_bytes, n_lines
+
+
+def measure_file(path: str, chunk_size: int = 1 << 20) -> Tuple[int, int]:
+    """Size of a data file in bytes and lines, counting lines a chunk at a time."""
+    with mapped_file(path) as data:
+        n_bytes = len(data)
+        n_lines = sum(
+            data[start:start + chunk_size].count(b"\n") for start in range(0, n_bytes, chunk_size)
+        )
+        if n_bytes and data[n_bytes - 1:n_bytes] != b"\n":
+            n_lines += 1
+    return n_bytes, n_lines
+
+
+class Instrumenter:
+    """Wraps a day's functions, emitting an event to the sink for each call."""
+
+    def __init__(self, day: int, sink: TextIO):
+        """Initialise for the given day, with no raw input seen yet."""
+        self.day = day
+        self.sink = sink
+        self.input_size: Tuple[Optional[int], Optional[int]] = (None, None)
+
+    def wrap(self, func: Callable, name: str) -> Callable:
+        """Wrap a function to emit an event each time it's called."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for arg in (*args, *kwargs.values()):
+                if (size := measure_input(arg)) is not None:
+                    self.input_size = size
+                    break
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.emit(name, time.perf_counter() - start)
+
+        return wrapper
+
+    def emit(self, name: str, duration: float) -> None:
+        """Write a single event to the sink."""
+        event = {
+            "timestamp": time.time(),
+            "day": self.day,
+            "function": name,
+            "input_bytes": self.input_size[0],
+            "input_lines": self.input_size[1],
+            "duration_s": duration,
+            "peak_rss_kb": peak_rss_kb(),
+        }
+        self.sink.write(json.dumps(event) + "\n")
+
+    def instrument(self, module: ModuleType) -> None:
+        """Replace the module's hot-path functions and methods with instrumented versions."""
+        for name in FUNCTIONS:
+            if callable(getattr(module, name, None)):
+                setattr(module, name, self.wrap(getattr(module, name), name))
+        for class_name, method_names in METHODS.items():
+            cls = getattr(module, class_name, None)
+            if not isinstance(cls, type):
+                continue
+            for method_name in method_names:
+                method = cls.__dict__.get(method_name)
+                qualified_name = f"{class_name}.{method_name}"
+                if isinstance(method, classmethod):
+                    wrapped = classmethod(self.wrap(method.__func__, qualified_name))
+                    setattr(cls, method_name, wrapped)
+                elif callable(method):
+                    setattr(cls, method_name, self.wrap(method, qualified_name))
+
+
+def instrument_module(module: ModuleType, day: int) -> None:
+    """Instrument a freshly loaded solution module, if instrumentation is switched on."""
+    sink = get_sink()
+    if sink is not None:
+        instrumenter = Instrumenter(day, sink)
+        instrumenter.instrument(module)
+        setattr(module, INSTRUMENTER_ATTR, instrumenter)
+
+
+def record_input(module: ModuleType, data: Any = None, path: Optional[str] = None) -> None:
+    """Record the size of the raw input (or the data file at `path`) a day is about to parse.
+
+    Does nothing unless the module is instrumented, so the input isn't measured needlessly.
+
+    """
+    instrumenter = getattr(module, INSTRUMENTER_ATTR, None)
+    if instrumenter is None:
+        return
+    size = measure_file(path) if path is not None else measure_input(data)
+    if size is not None:
+        instrumenter.input_size = size
@@ -0,0 +1,97 @@
+"""Memory-mapped, streaming input loading shared by all days.
+
+Reading a data file with `open(...).read()` followed by `.strip().splitlines()` (or `.split()`)
+creates several full copies of the input in memory before any parsing begins. The helpers here
+instead memory-map the file, and hand out one line, one blank-line separated record, or one
+zero-copy byte range at a time, so that peak memory stays flat however large the input grows.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def mapped_file(path: str) -> Iterator[Buffer]:
+    """Memory-map a file read-only for the duration of the context.
+
+    Empty files cannot be memory-mapped, so an empty bytes object is provided in their place.
+
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_lines(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """Yield each line of a file in turn, without line endings."""
+    with mapped_file(path) as data:
+        if not data:
+            return
+        for line in iter(data.readline, b""):
+            yield line.rstrip(b"\r\n").decode(encoding)
+
+
+def iter_records(path: str, encoding: str = "utf-8") -> Iterator[List[str]]:
+    """Yield the lines of each blank-line separated record of a file in turn.
+
+    Consecutive blank lines (including any at the very start or end of the file) never produce
+    empty records.
+
+    """
+    record = []
+    for line in iter_lines(path, encoding=encoding):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def iter_byte_ranges(data: Buffer, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Split a buffer into `(start, stop)` ranges of at least `chunk_size` bytes.
+
+    Each range is extended up to and including the next newline, so that no line is ever split
+    between two ranges.
+
+    """
+    start = 0
+    while start < len(data):
+        newline = data.find(b"\n", min(start + chunk_size, len(data)) - 1)
+        stop = len(data) if newline == -1 else newline + 1
+        yield start, stop
+        start = stop
+
+
+def iter_chunks(path: str, chunk_size: int = 1 << 20) -> Iterator[memoryview]:
+    """Yield zero-copy views over consecutive newline-aligned chunks of a file.
+
+    Each view is only valid until the next chunk is requested, and must not be kept beyond that -
+    copy it with `bytes(view)` if it needs to outlive the iteration.
+
+    """
+    with mapped_file(path) as data:
+        with memoryview(data) as view:
+            for start, stop in iter_byte_ranges(data, chunk_size):
+                with view[start:stop] as chunk:
+                    yield chunk
+
+
+def read_stripped(path: str) -> bytes:
+    """Read a whole file as bytes without surrounding whitespace, copying its contents just once."""
+    with mapped_file(path) as data:
+        start, stop = 0, len(data)
+        while start < stop and data[start:start + 1].isspace():
+            start += 1
+        while stop > start and data[stop - 1:stop].isspace():
+            stop -= 1
+        return data[start:stop]
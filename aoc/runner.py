@@ -0,0 +1,187 @@
+"""Run every day's solution in parallel, timing the parse and both parts of each day.
+
+Each day is executed in its own worker process from a process pool, so the full set of days
+completes in roughly the time of the slowest day rather than the sum of all of them. For each
+stage (parse, part 1 and part 2) both the wall clock time and the CPU time of the worker process
+are recorded and reported separately. Days which can answer both parts together, sharing the
+work between them, do so in a single stage, reported under part 1.
+
+Usage (from the repository root):
+
+    python -m aoc.runner
+    python -m aoc.runner --days 5 12 14 --workers 4
+    python -m aoc.runner --streaming
+    python -m aoc.runner --cache
+    python -m aoc.runner --grid
+
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from aoc.cache import ParseCache
+from aoc.days import GRID_PUZZLES, Day, discover_days, get_puzzle, load_module, read_data
+from aoc.instrument import record_input
+
+STAGES = ("parse", "part_1", "part_2")
+# Standard library modules used across the solutions, imported once up front rather than per day
+PRELOAD_MODULES = ("copy", "dataclasses", "json", "math", "re", "typing")
+
+
+class StageTiming(NamedTuple):
+    """Wall clock and CPU time taken by a single stage, in seconds."""
+
+    wall: float
+    cpu: float
+
+
+class DayResult(NamedTuple):
+    """Answers and per-stage timings for a single day.
+
+    Where both parts were answered together, their timing is given for part 1 and part 2's is None.
+
+    """
+
+    day: Day
+    part_1: Any
+    part_2: Any
+    timings: Tuple[StageTiming, StageTiming, Optional[StageTiming]]
+
+
+def timed(func: Callable, *args: Any) -> Tuple[Any, StageTiming]:
+    """Call a function, returning its result along with its wall clock and CPU time."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = func(*args)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return result, StageTiming(wall=wall, cpu=cpu)
+
+
+def run_day(
+    day: Day, streaming: bool = False, cache: bool = False, grid: bool = False
+) -> DayResult:
+    """Load and run a single day's solution, timing each stage.
+
+    When `streaming`, days that support it parse their data file by streaming it from disk, with
+    the time taken to read the file included in the parse stage. When `cache`, parsed inputs are
+    loaded from the on-disk parse cache where possible (see `aoc.cache`). When `grid`, the
+    grid-based days run their alternative recipes on compact `aoc.grid.Grid`s instead.
+
+    Any output the solution itself writes to stdout is discarded, as results are reported back to
+    the parent process instead.
+
+    """
+    puzzle = get_puzzle(day.number, grid=grid)
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        module = load_module(day)
+        if streaming and puzzle.parse_streaming:
+            record_input(module, path=day.data_path)
+            parsed, parse_timing = timed(puzzle.parse_streaming, module, day.data_path)
+        elif cache:
+            raw = read_data(day, module)
+            record_input(module, raw)
+            parse = functools.partial(puzzle.parse, module)
+            recipe = "grid" if grid and day.number in GRID_PUZZLES else "default"
+            parsed, parse_timing = timed(ParseCache().get_or_parse, module, raw, parse, recipe)
+        else:
+            raw = read_data(day, module)
+            record_input(module, raw)
+            parsed, parse_timing = timed(puzzle.parse, module, raw)
+        if puzzle.both_parts:
+            (part_1, part_2), part_1_timing = timed(puzzle.both_parts, module, parsed)
+            part_2_timing = None
+        else:
+            part_1, part_1_timing = timed(puzzle.part_1, module, parsed)
+            part_2, part_2_timing = timed(puzzle.part_2, module, parsed)
+    return DayResult(day, part_1, part_2, (parse_timing, part_1_timing, part_2_timing))
+
+
+def preload() -> None:
+    """Import the modules shared by the solutions, so loading each day doesn't pay for them."""
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+
+
+def run_all(
+    days: List[Day],
+    workers: Optional[int] = None,
+    streaming: bool = False,
+    cache: bool = False,
+    grid: bool = False,
+) -> List[DayResult]:
+    """Run the given days across a process pool, returning results in day order.
+
+    Shared modules are preloaded before the pool starts, so that forked workers inherit them,
+    and again as each worker starts, for platforms where workers are spawned instead.
+
+    """
+    preload()
+    run = functools.partial(run_day, streaming=streaming, cache=cache, grid=grid)
+    with ProcessPoolExecutor(max_workers=workers, initializer=preload) as executor:
+        return list(executor.map(run, days))
+
+
+def format_report(results: List[DayResult], total_wall: float) -> str:
+    """Format the results of a run as a table of answers and timings (in milliseconds)."""
+    header = f"{'Day':<4}" + "".join(f"{stage + ' wall/cpu':>22}" for stage in STAGES)
+    lines = [header, "-" * len(header)]
+    for result in results:
+        row = f"{result.day.number:<4}"
+        for timing in result.timings:
+            if timing is None:
+                row += f"{'(with part 1)':>22}"
+            else:
+                row += f"{timing.wall * 1000:>12.1f}/{timing.cpu * 1000:<9.1f}"
+        lines.append(row)
+    lines.append("")
+
+    # Append answers, indenting any multi-line answers (e.g. day 10's CRT output)
+    for result in results:
+        lines.append(f"Day {result.day.number:02} - {result.day.title}")
+        for part, answer in (("Part 1", result.part_1), ("Part 2", result.part_2)):
+            answer = str(answer).replace("\n", "\n    ")
+            lines.append(f"  {part}: {answer}")
+
+    serial_wall = sum(
+        timing.wall for result in results for timing in result.timings if timing is not None
+    )
+    lines.append("")
+    lines.append(f"Total wall time: {total_wall:.3f}s (sum of stages: {serial_wall:.3f}s)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", help="Day numbers to run (default: all).")
+    parser.add_argument("--workers", type=int, help="Size of the process pool (default: CPUs).")
+    parse_mode = parser.add_mutually_exclusive_group()
+    parse_mode.add_argument(
+        "--streaming", action="store_true", help="Stream data files from disk while parsing."
+    )
+    parse_mode.add_argument(
+        "--cache", action="store_true", help="Load parsed inputs from the on-disk parse cache."
+    )
+    parser.add_argument(
+        "--grid", action="store_true", help="Run the grid-based days on compact grids."
+    )
+    args = parser.parse_args(argv)
+
+    days = [day for day in discover_days() if not args.days or day.number in args.days]
+    start = time.perf_counter()
+    results = run_all(
+        days, workers=args.workers, streaming=args.streaming, cache=args.cache, grid=args.grid
+    )
+    print(format_report(results, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()